@@ -0,0 +1,260 @@
+"""Benchmarks for ENTSO-E parsing and the price view builders.
+
+    python -m benchmarks.run                 # print timings
+    python -m benchmarks.run --save          # record benchmarks/baseline.json
+    python -m benchmarks.run --check         # fail on regressions / non-linear parsing
+
+Timings are the best of several repeats, reported per call and per price
+point. --check compares against the recorded baseline, which is machine
+specific: re-record it when moving to different hardware.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import timeit
+import typing as t
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+from spot.entsoe import (
+    FI_EIC,
+    DaySeries,
+    _simulate_15min_from_hourly,
+    parse_publication_days,
+    parse_publication_xml,
+)
+from spot.main import DayPrices
+from spot.series import PriceSeries
+from spot.standin import StandinConfig, publication_document
+from spot.views import build_chart_rows, build_view_model, price_range
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+# A case may take this many times its baseline before --check fails
+REGRESSION_TOLERANCE = 1.5
+# Per-point parse cost of the largest document vs the smallest of its kind
+LINEARITY_LIMIT = 2.0
+REPEATS = 5
+START_DAY = date(2025, 10, 1)
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    points: int
+    run: t.Callable[[], object]
+    # Cases sharing a group are compared for linear scaling
+    group: str | None = None
+
+
+def _document(days: int, resolution: str, gap_compressed: bool = False) -> bytes:
+    config = StandinConfig(resolution=resolution, gap_compressed=gap_compressed)
+    day_list = [START_DAY + timedelta(days=i) for i in range(days)]
+    return publication_document(config, FI_EIC, day_list, NOW).encode()
+
+
+def _sparse(document: bytes) -> bytes:
+    """Keep only the last Point of each Period: the longest possible leading gap."""
+
+    def keep_last_point(period: re.Match[bytes]) -> bytes:
+        body = period.group(0)
+        first = body.index(b"<Point>")
+        last = body.rindex(b"<Point>")
+        return body[:first] + body[last:]
+
+    return re.sub(rb"<Period>.*?</Period>", keep_last_point, document)
+
+
+def _points(document: bytes) -> int:
+    return sum(len(ds.points) for ds in parse_publication_days(document).values())
+
+
+def _hourly_series(days: int) -> DaySeries:
+    start = datetime.combine(START_DAY, datetime.min.time(), tzinfo=UTC)
+    prices = [float(i % 240 - 40) for i in range(24 * days)]
+    return DaySeries("FI", "hour", PriceSeries.from_prices(start, 3600, prices), None)
+
+
+def _day_prices(days: int) -> DayPrices:
+    start = datetime.combine(START_DAY, datetime.min.time(), tzinfo=UTC)
+    prices = [float(i % 240 - 40) for i in range(96 * days)]
+    return DayPrices(
+        "FI",
+        "quarter_hour",
+        PriceSeries.from_prices(start - timedelta(hours=3), 900, prices),
+        None,
+    )
+
+
+def build_cases() -> list[Case]:
+    cases: list[Case] = []
+    for name, days, resolution, group in [
+        ("parse/hour/1d", 1, "hour", "parse/hour"),
+        ("parse/hour/365d", 365, "hour", "parse/hour"),
+        ("parse/quarter/1d", 1, "quarter_hour", "parse/quarter"),
+        ("parse/quarter/30d", 30, "quarter_hour", "parse/quarter"),
+        ("parse/quarter/365d", 365, "quarter_hour", "parse/quarter"),
+    ]:
+        doc = _document(days, resolution)
+        cases.append(
+            Case(name, _points(doc), lambda d=doc: parse_publication_xml(d), group),
+        )
+
+    for days in (1, 365):
+        compressed = _document(days, "quarter_hour", gap_compressed=True)
+        cases.append(
+            Case(
+                f"parse/compressed/{days}d",
+                _points(compressed),
+                lambda d=compressed: parse_publication_xml(d),
+                "parse/compressed",
+            ),
+        )
+        sparse = _sparse(_document(days, "quarter_hour"))
+        cases.append(
+            Case(
+                f"parse/sparse/{days}d",
+                _points(sparse),
+                lambda d=sparse: parse_publication_xml(d),
+                "parse/sparse",
+            ),
+        )
+
+    for days in (1, 365):
+        hourly = _hourly_series(days)
+        cases.append(
+            Case(
+                f"simulate_15min/{days}d",
+                4 * len(hourly.points),
+                lambda h=hourly: _simulate_15min_from_hourly(h),
+            ),
+        )
+
+    for days in (2, 365):
+        dp = _day_prices(days)
+        n = len(dp.intervals)
+        cases.append(
+            Case(f"view_model/{days}d", n, lambda dp=dp: build_view_model(dp, 0.6)),
+        )
+        cases.append(
+            Case(
+                f"chart_rows/{days}d",
+                n,
+                lambda dp=dp: build_chart_rows(dp, START_DAY, 0.6),
+            ),
+        )
+        # Extrema are computed here, once per ingested day
+        cases.append(
+            Case(
+                f"day_prices/{days}d",
+                n,
+                lambda dp=dp: DayPrices(
+                    dp.market,
+                    dp.granularity,
+                    dp.intervals,
+                    None,
+                ),
+            ),
+        )
+        cases.append(
+            Case(
+                f"price_range/{days}d",
+                n,
+                lambda dp=dp: price_range([dp.extrema], 0.6),
+            ),
+        )
+    return cases
+
+
+def measure(case: Case) -> float:
+    timer = timeit.Timer(case.run)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+
+def check_linearity(
+    results: dict[str, dict[str, float]],
+    cases: list[Case],
+) -> list[str]:
+    problems: list[str] = []
+    groups: dict[str, list[Case]] = {}
+    for case in cases:
+        if case.group:
+            groups.setdefault(case.group, []).append(case)
+    for group, members in groups.items():
+        smallest = min(members, key=lambda c: c.points)
+        largest = max(members, key=lambda c: c.points)
+        per_point = results[largest.name]["ns_per_point"]
+        ratio = per_point / results[smallest.name]["ns_per_point"]
+        if ratio > LINEARITY_LIMIT:
+            problems.append(
+                f"{group}: {largest.name} costs {ratio:.1f}x more per point than "
+                f"{smallest.name} (limit {LINEARITY_LIMIT}x)",
+            )
+    return problems
+
+
+def check_baseline(results: dict[str, dict[str, float]], baseline: dict) -> list[str]:
+    problems: list[str] = []
+    for name, result in results.items():
+        recorded = baseline.get("cases", {}).get(name)
+        if recorded is None:
+            continue
+        if result["seconds"] > recorded["seconds"] * REGRESSION_TOLERANCE:
+            problems.append(
+                f"{name}: {result['seconds'] * 1e3:.3f} ms vs baseline "
+                f"{recorded['seconds'] * 1e3:.3f} ms",
+            )
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="record the baseline")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument("-k", default="", help="only run cases containing this")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in build_cases() if args.k in c.name]
+    results: dict[str, dict[str, float]] = {}
+    print(f"{'case':<24} {'points':>8} {'ms/call':>10} {'ns/point':>10}")
+    for case in cases:
+        seconds = measure(case)
+        results[case.name] = {
+            "points": case.points,
+            "seconds": seconds,
+            "ns_per_point": seconds * 1e9 / case.points,
+        }
+        print(
+            f"{case.name:<24} {case.points:>8} {seconds * 1e3:>10.3f} "
+            f"{seconds * 1e9 / case.points:>10.1f}",
+        )
+
+    if args.save:
+        BASELINE_PATH.write_text(
+            json.dumps(
+                {"python": sys.version.split()[0], "cases": results},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+        )
+        print(f"Baseline written to {BASELINE_PATH}")
+
+    if not args.check:
+        return 0
+    problems = check_linearity(results, cases)
+    if BASELINE_PATH.exists():
+        problems += check_baseline(results, json.loads(BASELINE_PATH.read_text()))
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import typing as t
+
+# Concurrent /events/version streams per worker
+SSE_MAX_CLIENTS = int(os.environ.get("SPOT_SSE_MAX_CLIENTS", "5000"))
+# Events buffered per client before it counts as too slow and is dropped
+SSE_QUEUE_SIZE = int(os.environ.get("SPOT_SSE_QUEUE_SIZE", "16"))
+logger = logging.getLogger("spot.broadcast")
+
+# Queued for an evicted client in place of its pending events
+CLOSED = b""
+
+
+def encode_event(event: dict[str, t.Any]) -> bytes:
+    return f"data: {json.dumps(event)}\n\n".encode()
+
+
+class BroadcastHub:
+    """Fans server-sent events out to the connected clients of one worker.
+
+    Each event is encoded once and put on every client's bounded queue
+    without waiting. A client whose queue is full gets CLOSED instead and is
+    removed, so one slow connection never holds up the others.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = SSE_MAX_CLIENTS,
+        queue_size: int = SSE_QUEUE_SIZE,
+    ) -> None:
+        self.max_clients = max_clients
+        self.queue_size = queue_size
+        self._clients: set[asyncio.Queue[bytes]] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def full(self) -> bool:
+        return len(self._clients) >= self.max_clients
+
+    def subscribe(self) -> asyncio.Queue[bytes] | None:
+        """A queue receiving every published event, or None at the cap."""
+        if self.full():
+            return None
+        queue: asyncio.Queue[bytes] = asyncio.Queue(self.queue_size)
+        self._clients.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes]) -> None:
+        self._clients.discard(queue)
+
+    def publish(self, event: dict[str, t.Any]) -> None:
+        message = encode_event(event)
+        slow: list[asyncio.Queue[bytes]] = []
+        for queue in self._clients:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                slow.append(queue)
+        for queue in slow:
+            self._clients.discard(queue)
+            # Drop the backlog so the stream ends right after CLOSED
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(CLOSED)
+        if slow:
+            logger.warning(f"Dropped {len(slow)} event streams that fell behind")
@@ -1,42 +1,218 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib.util
 import logging
 import os
+import random
+import time
 import typing as t
 import xml.etree.ElementTree as ET
+from array import array
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import UTC, date, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from decimal import Decimal
+from email.utils import parsedate_to_datetime
 
 import httpx
-from dateutil import tz
 
-if t.TYPE_CHECKING:
-    from decimal import Decimal
+from .resample import resample
+from .series import (
+    PricePoint,  # noqa: F401 - re-exported for callers of this module
+    PriceSeries,
+    concat_series,
+    split_by_local_date,
+)
+from .singleflight import SingleFlight
+from .zones import DEFAULT_ZONE, get_zone
 
 FI_EIC = "10YFI-1--------U"
+# ENTSO-E answers A44 queries for at most one year per request
+MAX_QUERY_DAYS = 365
 # Allow overriding via env; default to known working host
 ENTSOE_BASE_URL = os.environ.get("ENTSOE_BASE_URL", "https://web-api.tp.entsoe.eu/api")
 logger = logging.getLogger("spot.entsoe")
 
+# Connection pool and timeouts for the shared upstream client
+HTTP_TIMEOUT_SECONDS = float(os.environ.get("ENTSOE_HTTP_TIMEOUT", "30"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(
+    os.environ.get("ENTSOE_HTTP_CONNECT_TIMEOUT", "10"),
+)
+HTTP_MAX_CONNECTIONS = int(os.environ.get("ENTSOE_HTTP_MAX_CONNECTIONS", "10"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("ENTSOE_HTTP_MAX_KEEPALIVE_CONNECTIONS", "5"),
+)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.environ.get("ENTSOE_HTTP_KEEPALIVE_EXPIRY", "120"),
+)
+
+# Process-wide upstream policy. ENTSO-E allows 400 requests per minute per
+# user and bans offenders for 10 minutes, so stay well below that.
+RATE_LIMIT_PER_MINUTE = float(os.environ.get("ENTSOE_RATE_LIMIT_PER_MINUTE", "300"))
+RATE_LIMIT_BURST = float(os.environ.get("ENTSOE_RATE_LIMIT_BURST", "20"))
+MAX_RETRIES = int(os.environ.get("ENTSOE_MAX_RETRIES", "3"))
+RETRY_BASE_DELAY_SECONDS = float(os.environ.get("ENTSOE_RETRY_BASE_DELAY", "1"))
+RETRY_MAX_DELAY_SECONDS = float(os.environ.get("ENTSOE_RETRY_MAX_DELAY", "30"))
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("ENTSOE_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.environ.get("ENTSOE_BREAKER_RESET", "60"))
+
 
 class DataNotAvailable(Exception):
     """Raised when ENTSO-E returns no time series for the requested period."""
 
 
-@dataclass(frozen=True)
-class PricePoint:
-    start_utc: datetime
-    end_utc: datetime
-    price_eur_per_mwh: float
+class NotModified(Exception):
+    """Raised when a refetch returned the same content as the known digest."""
+
+
+class UpstreamUnavailable(Exception):
+    """Raised without contacting ENTSO-E while the circuit breaker is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"ENTSO-E circuit open; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Async token bucket; callers reserve a token and sleep until it is due."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_second,
+        )
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate_per_second)
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug(f"Upstream rate limit: waiting {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """Fail fast after repeated upstream failures; let one trial through later."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        if self._opened_at is None:
+            return
+        remaining = self._opened_at + self.reset_seconds - self._clock()
+        if remaining > 0 or self._trial_in_flight:
+            raise UpstreamUnavailable(max(remaining, 1.0))
+        logger.info("Circuit breaker half-open: sending trial request to ENTSO-E")
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("Circuit breaker closed: ENTSO-E is responding again")
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            logger.warning(
+                f"Circuit breaker open after {self._failures} failures; "
+                f"failing fast for {self.reset_seconds:.0f}s",
+            )
+            self._opened_at = self._clock()
+
+    def release_trial(self) -> None:
+        """Let another request be the trial, e.g. after this one was cancelled."""
+        self._trial_in_flight = False
+
+
+_rate_limiter = TokenBucket(RATE_LIMIT_PER_MINUTE / 60.0, RATE_LIMIT_BURST)
+_circuit_breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS)
+# In-flight day fetches keyed by (bidding zone EIC, market date, known digest)
+_day_fetches: SingleFlight[tuple[str, date, str | None], DaySeries] = SingleFlight()
+
+
+Granularity: t.TypeAlias = t.Literal["hour", "quarter_hour"]
 
 
 @dataclass(frozen=True)
 class DaySeries:
     market: str
-    granularity: t.Literal["hour", "quarter_hour"]
-    points: list[PricePoint]
+    granularity: Granularity
+    points: PriceSeries
     published_at_utc: datetime | None
+    revision: int | None = None
+    content_digest: str | None = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the long-lived, pooled client used for all ENTSO-E requests.
+
+    HTTP/2 is negotiated when the optional ``h2`` package is installed; otherwise
+    the client keeps HTTP/1.1 connections alive between requests.
+    """
+    http2 = importlib.util.find_spec("h2") is not None
+    logger.info(
+        f"Creating ENTSO-E HTTP client (http2={http2}, "
+        f"max_connections={HTTP_MAX_CONNECTIONS}, timeout={HTTP_TIMEOUT_SECONDS}s)",
+    )
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(
+            HTTP_TIMEOUT_SECONDS,
+            connect=HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+@asynccontextmanager
+async def _use_client(
+    client: httpx.AsyncClient | None,
+) -> t.AsyncIterator[httpx.AsyncClient]:
+    # Callers without an app-scoped client (scripts, tests) get a temporary one
+    if client is not None:
+        yield client
+        return
+    async with create_http_client() as temporary_client:
+        yield temporary_client
 
 
 def _iso_to_dt(value: str) -> datetime:
@@ -51,137 +227,294 @@ def _duration_to_granularity(duration: str) -> str:
     raise ValueError(f"Unsupported resolution: {duration}")
 
 
-def parse_publication_xml(xml_bytes: bytes) -> DaySeries:
-    root = ET.fromstring(xml_bytes)
-    ns = {"ns": root.tag.split("}")[0].strip("{")}
-    local_name = root.tag.split("}")[-1]
+Period: t.TypeAlias = tuple[Granularity, PriceSeries]
 
-    if local_name.endswith("Acknowledgement_MarketDocument"):
-        # Try to extract reason text for diagnostics
-        reasons = [e.text or "" for e in root.findall(".//ns:Reason/ns:text", ns)]
-        msg = "; ".join([r for r in reasons if r]) or "No TimeSeries (acknowledgement)"
-        raise DataNotAvailable(msg)
 
-    ts_list = root.findall(".//ns:TimeSeries", ns)
-    if not ts_list:
-        # Many cases: No content yet
-        raise DataNotAvailable("No TimeSeries in response")
+# Everything before the first TimeSeries is header that ENTSO-E regenerates on
+# every request (mRID, createdDateTime), so it is left out of content digests
+_CONTENT_MARKER = b"<TimeSeries"
 
-    all_points: list[PricePoint] = []
-    granularity: t.Literal["hour", "quarter_hour"] | None = None
-    published_at: datetime | None = None
 
-    for ts in ts_list:
-        period = ts.find(".//ns:Period", ns)
-        if period is None:
-            continue
-        resolution = period.findtext("ns:resolution", default="", namespaces=ns)
-        g = _duration_to_granularity(resolution)
-        if granularity is None:
-            granularity = t.cast("t.Literal['hour', 'quarter_hour']", g)
-        start_str = period.findtext("ns:timeInterval/ns:start", namespaces=ns)
-        end_str = period.findtext("ns:timeInterval/ns:end", namespaces=ns)
-        if not start_str or not end_str:
-            continue
-        start_dt = _iso_to_dt(start_str)
-        end_dt = _iso_to_dt(end_str)
-        step = timedelta(hours=1) if g == "hour" else timedelta(minutes=15)
+class _ContentDigest:
+    def __init__(self) -> None:
+        self._sha = hashlib.sha256()
+        self._pending = b""
+        self._started = False
+
+    def update(self, data: bytes) -> None:
+        if self._started:
+            self._sha.update(data)
+            return
+        data = self._pending + data
+        start = data.find(_CONTENT_MARKER)
+        if start == -1:
+            self._pending = data[-(len(_CONTENT_MARKER) - 1) :]
+            return
+        self._started = True
+        self._pending = b""
+        self._sha.update(data[start:])
+
+    def hexdigest(self) -> str:
+        return self._sha.hexdigest()
+
 
-        pts = sorted(
-            period.findall("ns:Point", ns),
-            key=lambda e: int(e.findtext("ns:position", default="0", namespaces=ns)),
+def publication_digest(body: bytes) -> str:
+    """Digest of a publication's price content, ignoring its volatile header."""
+    digest = _ContentDigest()
+    digest.update(body)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class PublicationInfo:
+    published_at_utc: datetime | None
+    revision: int | None
+    content_digest: str
+
+
+class PublicationParser:
+    """Incremental parser for ENTSO-E publication documents.
+
+    Bytes are fed as they arrive from the network. Each completed Period is
+    expanded into a price series and returned from feed() right away, and its
+    elements are discarded, so memory stays flat regardless of document size.
+    Header metadata and the content digest are available from `info`.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._digest = _ContentDigest()
+        self._root: ET.Element | None = None
+        self._ns = ""
+        self._in_reason = False
+        self._reasons: list[str] = []
+        self._saw_time_series = False
+        self._last_price: float | None = None
+        self._created_at: datetime | None = None
+        self._revision: int | None = None
+
+    @property
+    def info(self) -> PublicationInfo:
+        return PublicationInfo(
+            published_at_utc=self._created_at,
+            revision=self._revision,
+            content_digest=self._digest.hexdigest(),
         )
+
+    def feed(self, data: bytes) -> list[Period]:
+        self._digest.update(data)
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[Period]:
+        """Finish the document; raises DataNotAvailable if it carried no prices."""
+        self._parser.close()
+        periods = self._drain()
+        if self._root is not None and self._root.tag.endswith(
+            "Acknowledgement_MarketDocument",
+        ):
+            msg = "; ".join(r for r in self._reasons if r)
+            raise DataNotAvailable(msg or "No TimeSeries (acknowledgement)")
+        if not self._saw_time_series:
+            # Many cases: No content yet
+            raise DataNotAvailable("No TimeSeries in response")
+        return periods
+
+    def _drain(self) -> list[Period]:
+        periods: list[Period] = []
+        for event, elem in self._parser.read_events():
+            name = elem.tag.rpartition("}")[2]
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                    self._ns = elem.tag[: len(elem.tag) - len(name)]
+                elif name == "TimeSeries":
+                    self._saw_time_series = True
+                elif name == "Reason":
+                    self._in_reason = True
+                continue
+            if name == "Period":
+                periods.append(self._expand_period(elem))
+            elif name == "TimeSeries" and self._root is not None:
+                # Drop everything processed so far, including this series
+                self._root.clear()
+            elif self._saw_time_series:
+                continue
+            elif name == "createdDateTime" and elem.text:
+                self._created_at = _iso_to_dt(elem.text.strip())
+            elif name == "revisionNumber" and elem.text:
+                self._revision = int(elem.text)
+            elif name == "Reason":
+                self._in_reason = False
+            elif name == "text" and self._in_reason:
+                self._reasons.append(elem.text or "")
+        return periods
+
+    def _expand_period(self, period: ET.Element) -> Period:
+        ns = self._ns
+        resolution = period.findtext(f"{ns}resolution", default="")
+        g = t.cast("Granularity", _duration_to_granularity(resolution))
+        start_str = period.findtext(f"{ns}timeInterval/{ns}start")
+        end_str = period.findtext(f"{ns}timeInterval/{ns}end")
+        step = 3600 if g == "hour" else 900
+        if not start_str or not end_str:
+            return g, PriceSeries.from_prices(0, step, ())
+        start_epoch = int(_iso_to_dt(start_str).timestamp())
+        count = (int(_iso_to_dt(end_str).timestamp()) - start_epoch) // step
+
         pos_to_price: dict[int, float] = {}
-        for p in pts:
-            pos = int(p.findtext("ns:position", default="0", namespaces=ns))
-            amount_text = p.findtext("ns:price.amount", default="0", namespaces=ns)
-            price = float(amount_text)
-            pos_to_price[pos] = price
-
-        # Fill sequentially; ENTSO-E may skip positions to compress equal values
-        idx = 1
-        cur = start_dt
-        while cur < end_dt:
-            price = pos_to_price.get(idx)
-            if price is None:
-                if not all_points:
-                    price = next(
-                        (v for k, v in sorted(pos_to_price.items()) if k >= idx),
-                        0.0,
-                    )
-                else:
-                    price = all_points[-1].price_eur_per_mwh
-            pt_end = cur + step
-            all_points.append(PricePoint(cur, pt_end, price))
-            cur = pt_end
-            idx += 1
-
-    if granularity is None:
+        for p in period.iterfind(f"{ns}Point"):
+            pos = int(p.findtext(f"{ns}position", default="0"))
+            pos_to_price[pos] = float(p.findtext(f"{ns}price.amount", default="0"))
+
+        # Fill sequentially; ENTSO-E may skip positions to compress equal values.
+        # A leading gap takes the first explicit price of the document.
+        if self._last_price is None and pos_to_price:
+            self._last_price = pos_to_price[min(pos_to_price)]
+        last_price = 0.0 if self._last_price is None else self._last_price
+        prices = array("d", bytes(8 * count))
+        for idx in range(count):
+            last_price = pos_to_price.get(idx + 1, last_price)
+            prices[idx] = last_price
+        self._last_price = last_price
+        return g, PriceSeries.from_prices(start_epoch, step, prices)
+
+
+def _merge_periods(periods: t.Sequence[Period]) -> Period:
+    """Merge periods into one series at the finest step among them.
+
+    Coarser periods are upsampled, e.g. the hourly day before the switch to
+    15-minute products, so none of their prices are lost.
+    """
+    granularity, finest = min(periods, key=lambda p: p[1].step_seconds)
+    step = finest.step_seconds
+    return granularity, concat_series([resample(s, step) for _, s in periods])
+
+
+def _series_from_periods(
+    periods: t.Iterable[Period],
+    info: PublicationInfo | None = None,
+    zone: str = DEFAULT_ZONE,
+) -> DaySeries:
+    periods = list(periods)
+    if not periods:
         raise ValueError("Could not determine granularity")
+    granularity, points = _merge_periods(periods)
 
     return DaySeries(
-        market="FI",
+        market=zone,
         granularity=granularity,
-        points=all_points,
-        published_at_utc=published_at,
+        points=points,
+        published_at_utc=info.published_at_utc if info else None,
+        revision=info.revision if info else None,
+        content_digest=info.content_digest if info else None,
+    )
+
+
+def _split_periods_by_day(
+    periods: t.Iterable[Period],
+    info: PublicationInfo | None = None,
+    zone: str = DEFAULT_ZONE,
+) -> dict[date, DaySeries]:
+    days: dict[date, list[Period]] = {}
+    zone_tz = get_zone(zone).tz
+    for g, series in periods:
+        for day, part in split_by_local_date(series, zone_tz).items():
+            days.setdefault(day, []).append((g, part))
+
+    result: dict[date, DaySeries] = {}
+    for day, parts in sorted(days.items()):
+        g, points = _merge_periods(parts)
+        # The document digest covers every day, so it is not meaningful per day
+        result[day] = DaySeries(
+            market=zone,
+            granularity=g,
+            points=points,
+            published_at_utc=info.published_at_utc if info else None,
+            revision=info.revision if info else None,
+        )
+    return result
+
+
+def parse_publication_xml(xml_bytes: bytes, zone: str = DEFAULT_ZONE) -> DaySeries:
+    parser = PublicationParser()
+    periods = parser.feed(xml_bytes) + parser.close()
+    return _series_from_periods(periods, parser.info, zone)
+
+
+def parse_publication_days(
+    xml_bytes: bytes,
+    zone: str = DEFAULT_ZONE,
+) -> dict[date, DaySeries]:
+    """Split a (possibly multi-day) publication into one series per local day.
+
+    A day covered by series of different resolutions gets the finest one;
+    when series overlap, the later one wins.
+    """
+    parser = PublicationParser()
+    periods = parser.feed(xml_bytes) + parser.close()
+    return _split_periods_by_day(periods, parser.info, zone)
+
+
+def _local_period(
+    start_date: date,
+    end_date: date,
+    zone_tz: tzinfo,
+) -> tuple[datetime, datetime]:
+    # ENTSO-E expects the UTC instants of the local (market day) boundaries
+    period_start_local = datetime.combine(
+        start_date,
+        datetime.min.time(),
+        tzinfo=zone_tz,
     )
+    period_end_local = datetime.combine(
+        end_date,
+        datetime.min.time(),
+        tzinfo=zone_tz,
+    )
+    return period_start_local.astimezone(UTC), period_end_local.astimezone(UTC)
 
 
 async def fetch_day_ahead_prices(
     token: str,
     target_date: date,
     prefer_15min: bool = False,
+    client: httpx.AsyncClient | None = None,
+    known_digest: str | None = None,
+    zone: str = DEFAULT_ZONE,
 ) -> DaySeries:
-    # Create Helsinki timezone start and end times, then convert to UTC
+    """Fetch one local day of prices for bidding zone `zone`.
+
+    Pass the `content_digest` of a previously fetched series as `known_digest`
+    to get NotModified instead of a re-parsed, identical series.
+    """
+    bidding_zone = get_zone(zone)
     # ENTSO-E expects local time boundaries for the market data
-    helsinki_tz = tz.gettz("Europe/Helsinki")
-
-    period_start_local = datetime(
-        target_date.year,
-        target_date.month,
-        target_date.day,
-        0,
-        0,
-        tzinfo=helsinki_tz,
+    period_start, period_end = _local_period(
+        target_date,
+        target_date + timedelta(days=1),
+        bidding_zone.tz,
     )
-    period_end_local = period_start_local + timedelta(days=1)
-
-    # Convert to UTC for the API request
-    period_start = period_start_local.astimezone(UTC)
-    period_end = period_end_local.astimezone(UTC)
     logger.info(f"UTC conversion: {period_start} to {period_end}")
 
-    # Try 15-minute resolution first if preferred and date is after Oct 1, 2025
+    # ENTSO-E has no resolution parameter and always returns the finest
+    # resolution it holds, so one response serves both the 15-minute
+    # preference and the hourly fallback. Concurrent callers share it.
     if prefer_15min and target_date >= date(2025, 10, 1):
-        logger.info(f"Attempting to fetch 15-minute resolution for {target_date}")
-        try:
-            result = await _fetch_with_resolution(
-                token,
-                period_start,
-                period_end,
-                target_date,
-                prefer_quarter_hour=True,
-            )
-            if result.granularity == "quarter_hour":
-                logger.info(f"Successfully fetched 15-minute data for {target_date}")
-                return result
-            logger.info(
-                f"Got hourly data when requesting 15-minute for {target_date}, falling back",
-            )
-        except DataNotAvailable as e:
-            logger.info(
-                f"15-minute data not available for {target_date}: {e}, trying hourly",
-            )
-
-    # Fall back to hourly resolution or use it as default
-    logger.info(f"Fetching hourly resolution for {target_date}")
-    result = await _fetch_with_resolution(
-        token,
-        period_start,
-        period_end,
-        target_date,
-        prefer_quarter_hour=False,
+        logger.info(f"Requesting finest available resolution for {target_date}")
+    result = await _day_fetches.run(
+        (bidding_zone.eic, target_date, known_digest),
+        lambda: _fetch_with_resolution(
+            token,
+            period_start,
+            period_end,
+            target_date,
+            client=client,
+            known_digest=known_digest,
+            zone=bidding_zone.code,
+        ),
     )
+    logger.info(f"Fetched {result.granularity} data for {zone} {target_date}")
 
     # For testing: simulate 15-minute data by expanding hourly data
     if prefer_15min and result.granularity == "hour":
@@ -196,21 +529,16 @@ def _simulate_15min_from_hourly(hourly_data: DaySeries) -> DaySeries:
     if hourly_data.granularity != "hour":
         return hourly_data
 
-    simulated_points = []
-    for point in hourly_data.points:
-        # Create 4 identical 15-minute intervals for each hour
-        for quarter in range(4):
-            start_time = point.start_utc + timedelta(minutes=quarter * 15)
-            end_time = start_time + timedelta(minutes=15)
-            simulated_points.append(
-                PricePoint(start_time, end_time, point.price_eur_per_mwh),
-            )
+    # Repeat each hourly price for the 4 quarters of that hour
+    quarters = resample(hourly_data.points, 900)
 
     return DaySeries(
         market=hourly_data.market,
         granularity="quarter_hour",
-        points=simulated_points,
+        points=quarters,
         published_at_utc=hourly_data.published_at_utc,
+        revision=hourly_data.revision,
+        content_digest=hourly_data.content_digest,
     )
 
 
@@ -219,42 +547,218 @@ async def _fetch_with_resolution(
     period_start: datetime,
     period_end: datetime,
     target_date: date,
-    prefer_quarter_hour: bool = False,
+    client: httpx.AsyncClient | None = None,
+    known_digest: str | None = None,
+    zone: str = DEFAULT_ZONE,
 ) -> DaySeries:
-    """Internal helper to fetch data with specific resolution preference."""
+    """Internal helper to fetch one day at the finest available resolution."""
+    logger.debug(f"Fetching finest available resolution for {zone} {target_date}")
+    parser = PublicationParser()
+    async with _use_client(client) as http:
+        periods = [
+            period
+            async for period in _stream_periods(
+                http,
+                token,
+                period_start,
+                period_end,
+                parser,
+                known_digest,
+                get_zone(zone).eic,
+            )
+        ]
+    return _series_from_periods(periods, parser.info, zone)
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Honour Retry-After when given, otherwise full-jitter exponential backoff."""
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY_SECONDS)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                wait = (when - datetime.now(UTC)).total_seconds()
+                return min(max(wait, 0.0), RETRY_MAX_DELAY_SECONDS)
+    ceiling = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+@asynccontextmanager
+async def _upstream_response(
+    http: httpx.AsyncClient,
+    params: dict[str, str],
+) -> t.AsyncIterator[httpx.Response]:
+    """Open a streaming GET to ENTSO-E under the process-wide upstream policy.
+
+    Every attempt passes the circuit breaker and the rate limiter. Transport
+    errors, 429 and 5xx are retried with backoff; other errors are raised.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        # Wait for the token first: a trial must not sit in the rate limiter
+        await _rate_limiter.acquire()
+        _circuit_breaker.before_request()
+        request = http.build_request("GET", ENTSOE_BASE_URL, params=params)
+        try:
+            r = await http.send(request, stream=True)
+        except httpx.TransportError as e:
+            _circuit_breaker.record_failure()
+            if attempt == MAX_RETRIES:
+                raise
+            delay = _retry_delay(attempt, None)
+            logger.warning(f"ENTSO-E request failed ({e!r}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+        except BaseException:
+            # Cancelled (or failed) without an answer: neither success nor
+            # failure is recorded, so free the trial slot for the next caller
+            _circuit_breaker.release_trial()
+            raise
+
+        if r.status_code == 429 or r.status_code >= 500:
+            _circuit_breaker.record_failure()
+            await r.aclose()
+            if attempt == MAX_RETRIES:
+                r.raise_for_status()
+            delay = _retry_delay(attempt, r)
+            logger.warning(
+                f"ENTSO-E answered {r.status_code}; retrying in {delay:.1f}s",
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        _circuit_breaker.record_success()
+        try:
+            if r.is_error:
+                await r.aread()
+                r.raise_for_status()
+            yield r
+        except httpx.TransportError:
+            # Connection dropped mid-body; too late to retry transparently
+            _circuit_breaker.record_failure()
+            raise
+        finally:
+            await r.aclose()
+        return
+
+
+async def _stream_periods(
+    http: httpx.AsyncClient,
+    token: str,
+    period_start: datetime,
+    period_end: datetime,
+    parser: PublicationParser,
+    known_digest: str | None = None,
+    domain: str = FI_EIC,
+) -> t.AsyncIterator[Period]:
+    """Stream a publication and yield each Period as soon as it is parsed.
+
+    With `known_digest`, the body is hashed before parsing and NotModified is
+    raised if it matches, so an unchanged republication is never parsed.
+    """
     params = {
         "securityToken": token,
         "documentType": "A44",
         "processType": "A01",
-        "in_Domain": FI_EIC,
-        "out_Domain": FI_EIC,
+        "in_Domain": domain,
+        "out_Domain": domain,
         "periodStart": period_start.strftime("%Y%m%d%H%M"),
         "periodEnd": period_end.strftime("%Y%m%d%H%M"),
     }
-
-    # Add resolution hint if requesting quarter hour (15-minute)
-    # Note: ENTSO-E API doesn't have explicit resolution parameter,
-    # but will return the finest available resolution for the period
-    if prefer_quarter_hour:
-        # The API will return 15-minute data if available, hourly otherwise
-        logger.debug("Requesting finest available resolution (hoping for 15-minute)")
-
     safe_params = {k: v for k, v in params.items() if k != "securityToken"}
     logger.info(f"ENTSO-E GET {ENTSOE_BASE_URL} params={safe_params}")
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        r = await client.get(ENTSOE_BASE_URL, params=params)
-        if r.status_code == 429:
-            await asyncio.sleep(1)
-            r = await client.get(ENTSOE_BASE_URL, params=params)
-        r.raise_for_status()
+    async with _upstream_response(http, params) as r:
+        if known_digest is not None:
+            body = await r.aread()
+            if publication_digest(body) == known_digest:
+                raise NotModified(known_digest)
+            chunks: t.AsyncIterator[bytes] = _single_chunk(body)
+        else:
+            chunks = r.aiter_bytes()
+        head = b""
+        async for chunk in chunks:
+            if len(head) < 200:
+                head += chunk[: 200 - len(head)]
+            for period in parser.feed(chunk):
+                yield period
         try:
-            return parse_publication_xml(r.content)
+            tail = parser.close()
         except DataNotAvailable as e:
             # Log a short snippet for diagnostics
-            snippet = r.content[:200].decode(errors="ignore")
+            snippet = head.decode(errors="ignore")
             logger.info("ENTSO-E data not available: %s | body: %s", e, snippet)
             raise
+        for period in tail:
+            yield period
+
+
+async def _single_chunk(body: bytes) -> t.AsyncIterator[bytes]:
+    yield body
+
+
+async def fetch_day_ahead_price_range(
+    token: str,
+    start_date: date,
+    end_date: date,
+    prefer_15min: bool = False,
+    client: httpx.AsyncClient | None = None,
+    zone: str = DEFAULT_ZONE,
+) -> dict[date, DaySeries]:
+    """Fetch local days in [start_date, end_date) with as few requests as possible.
+
+    The window is requested in chunks of at most MAX_QUERY_DAYS, and each
+    returned document is split into per-day series. Days ENTSO-E has no data
+    for are missing from the result.
+    """
+    result: dict[date, DaySeries] = {}
+    bidding_zone = get_zone(zone)
+    async with _use_client(client) as http:
+        chunk_start = start_date
+        while chunk_start < end_date:
+            chunk_end = min(chunk_start + timedelta(days=MAX_QUERY_DAYS), end_date)
+            period_start, period_end = _local_period(
+                chunk_start,
+                chunk_end,
+                bidding_zone.tz,
+            )
+            parser = PublicationParser()
+            try:
+                days = _split_periods_by_day(
+                    [
+                        period
+                        async for period in _stream_periods(
+                            http,
+                            token,
+                            period_start,
+                            period_end,
+                            parser,
+                            domain=bidding_zone.eic,
+                        )
+                    ],
+                    parser.info,
+                    bidding_zone.code,
+                )
+            except DataNotAvailable as e:
+                logger.info(
+                    f"ENTSO-E data not available for {chunk_start}..{chunk_end}: {e}",
+                )
+                days = {}
+            for day, series in days.items():
+                if not chunk_start <= day < chunk_end:
+                    continue
+                if prefer_15min and series.granularity == "hour":
+                    series = _simulate_15min_from_hourly(series)
+                result[day] = series
+            logger.info(
+                f"Fetched {len(days)} days for {chunk_start}..{chunk_end} in one request",
+            )
+            chunk_start = chunk_end
+    return result
 
 
 def get_prices(
@@ -265,13 +769,10 @@ def get_prices(
     """Yield (UTC datetime, EUR/kWh) for the range [start_date, end_date).
 
     Matches the style shown in user's other project (periodStart/periodEnd built
-    as YYYYMMDD0000). Internally calls fetch_day_ahead_prices per day and
-    converts EUR/MWh to EUR/kWh.
+    as YYYYMMDD0000). Runs fetch_day_ahead_price_range to completion and
+    converts EUR/MWh to EUR/kWh; do not call from a running event loop.
     """
-    cur = start_date
-    one_day = timedelta(days=1)
-    while cur < end_date:
-        # Note: function is async, so we expose sync generator via run_until_complete
-        raise RuntimeError(
-            "get_prices requires an async runner; use fetch_day_ahead_prices directly in async contexts",
-        )
+    days = asyncio.run(fetch_day_ahead_price_range(token, start_date, end_date))
+    for _, series in sorted(days.items()):
+        for p in series.points:
+            yield p.start_utc, Decimal(str(p.price_eur_per_mwh)) / 1000
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+from datetime import UTC, datetime
+
+from .series import PriceSeries
+
+# Longest range one /api/export request may ask for
+EXPORT_MAX_DAYS = int(os.environ.get("SPOT_EXPORT_MAX_DAYS", "400"))
+
+ExportFormat: t.TypeAlias = t.Literal["csv", "ndjson"]
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+# Same fields as the intervals of /api/prices
+CSV_HEADER = b"startTimeUtc,endTimeUtc,priceAmount,priceCurrency,unit\n"
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch, UTC).isoformat()
+
+
+def export_header(fmt: ExportFormat) -> bytes:
+    return CSV_HEADER if fmt == "csv" else b""
+
+
+def export_rows(series: PriceSeries, fmt: ExportFormat) -> bytes:
+    """Encode the intervals of `series` as CSV or NDJSON lines."""
+    lines: list[str] = []
+    step = series.step_seconds
+    epoch = series.start_epoch
+    end = _iso(epoch)
+    for price in series.prices:
+        # Each interval ends where the next one starts
+        start, end = end, _iso(epoch + step)
+        if fmt == "csv":
+            lines.append(f"{start},{end},{price!r},EUR,MWh\n")
+        else:
+            lines.append(
+                json.dumps(
+                    {
+                        "startTimeUtc": start,
+                        "endTimeUtc": end,
+                        "priceAmount": price,
+                        "priceCurrency": "EUR",
+                        "unit": "MWh",
+                    },
+                )
+                + "\n",
+            )
+        epoch += step
+    return "".join(lines).encode()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import typing as t
+from collections import OrderedDict
+from datetime import date
+
+V = t.TypeVar("V")
+
+# Days kept in memory besides the live today/tomorrow cache
+HISTORY_CAPACITY = int(os.environ.get("SPOT_HISTORY_DAYS", "62"))
+
+
+class DayCache(t.Generic[V]):
+    """Date-keyed LRU cache for day prices.
+
+    Only days other than today and tomorrow pass through it, and those are
+    past days that never change once published, so entries stay until evicted.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[date, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, day: date) -> V | None:
+        value = self._entries.get(day)
+        if value is not None:
+            self._entries.move_to_end(day)
+        return value
+
+    def peek(self, day: date) -> V | None:
+        """Entry for `day` without touching LRU order."""
+        return self._entries.get(day)
+
+    def put(self, day: date, value: V) -> None:
+        self._entries[day] = value
+        self._entries.move_to_end(day)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
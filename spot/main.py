@@ -1,23 +1,62 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import gzip
 import logging
 import os
+import sqlite3
 import typing as t
-from dataclasses import dataclass, replace
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
 from datetime import UTC, date, datetime, timedelta
 
+import jinja2
 from dateutil import tz
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.background import BackgroundTask
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from .broadcast import CLOSED, BroadcastHub, encode_event
+from .entsoe import DaySeries
+from .export import (
+    EXPORT_MAX_DAYS,
+    MEDIA_TYPES,
+    ExportFormat,
+    export_header,
+    export_rows,
+)
+from .history import HISTORY_CAPACITY, DayCache
+from .resample import (
+    STEP_SECONDS,
+    Aggregation,
+    Granularity,
+    resample,
+    resample_daily,
+)
+from .responses import RESPONSE_CACHE_BYTES, ResponseCache
+from .series import PriceSeries, index_by_local_date
+from .shared import SHARED_DIR, SNAPSHOT_POLL_SECONDS, SharedState
+from .singleflight import SingleFlight
+from .store import STORE_PATH, PriceStore
+from .views import (
+    HIGH_PRICE_CENTS,
+    LOW_PRICE_CENTS,
+    ChartEncoding,
+    ChartFormat,
+    build_chart_rows,
+    build_view_model,
+    compact_chart_day,
+    current_slot,
+    price_range,
+)
+from .zones import ENABLED_ZONES, ZONES, get_zone
+
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
@@ -29,33 +68,129 @@ ENTSOE_API_TOKEN = os.environ.get("ENTSOE_API_TOKEN")
 DEFAULT_MARGIN_CENTS_PER_KWH = float(
     os.environ.get("DEFAULT_MARGIN_CENTS_PER_KWH", "0.60"),
 )
-VAT_RATE = 0.255
 HELSINKI_TZ = tz.gettz("Europe/Helsinki")
-
-
-@dataclass(frozen=True)
-class PriceInterval:
-    start_utc: datetime
-    end_utc: datetime
-    price_eur_per_mwh: float
+# Age after which the live cache is served as stale and revalidated; the
+# polling loop refreshes it at least every 15 minutes
+STALE_AFTER_SECONDS = float(os.environ.get("SPOT_STALE_AFTER_SECONDS", "1800"))
+# Retry-After for requests that arrive before startup has loaded any prices
+PENDING_RETRY_SECONDS = int(os.environ.get("SPOT_PENDING_RETRY_SECONDS", "5"))
+# Reload edited templates without a restart; for development only
+TEMPLATE_RELOAD = os.environ.get("SPOT_TEMPLATE_RELOAD", "0") == "1"
+# Compiled templates shared across workers and restarts; empty = system temp dir
+TEMPLATE_CACHE_DIR = os.environ.get("SPOT_TEMPLATE_CACHE_DIR", "")
 
 
 @dataclass(frozen=True)
 class DayPrices:
     market: str
     granularity: t.Literal["hour", "quarter_hour"]
-    intervals: list[PriceInterval]
+    intervals: PriceSeries
     published_at_utc: datetime | None
+    revision: int | None = None
+    content_digest: str | None = None
+    # Slice bounds of each local day in `intervals`, built once at ingest
+    day_index: dict[date, tuple[int, int]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # Lowest and highest price (EUR/MWh), None without prices; also built at
+    # ingest so chart axes do not scan the prices on every request
+    extrema: tuple[float, float] | None = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        index = index_by_local_date(self.intervals, get_zone(self.market).tz)
+        object.__setattr__(self, "day_index", index)
+        prices = self.intervals.prices
+        extrema = (min(prices), max(prices)) if len(prices) else None
+        object.__setattr__(self, "extrema", extrema)
+
+    def count(self, day: date) -> int:
+        lo, hi = self.day_index.get(day, (0, 0))
+        return hi - lo
+
+    def day(self, day: date) -> PriceSeries:
+        lo, hi = self.day_index.get(day, (0, 0))
+        return self.intervals[lo:hi]
+
+
+def _day_prices(ds: DaySeries) -> DayPrices:
+    return DayPrices(
+        market=ds.market,
+        granularity=ds.granularity,
+        intervals=ds.points,
+        published_at_utc=ds.published_at_utc,
+        revision=ds.revision,
+        content_digest=ds.content_digest,
+    )
+
+
+def _day_series(dp: DayPrices) -> DaySeries:
+    return DaySeries(
+        market=dp.market,
+        granularity=dp.granularity,
+        points=dp.intervals,
+        published_at_utc=dp.published_at_utc,
+        revision=dp.revision,
+        content_digest=dp.content_digest,
+    )
+
+
+def _same_prices(dp: DayPrices | None, ds: DaySeries | None) -> bool:
+    if dp is None or ds is None:
+        return dp is None and ds is None
+    return (
+        dp.content_digest == ds.content_digest
+        and dp.intervals.start_epoch == ds.points.start_epoch
+        and dp.intervals.step_seconds == ds.points.step_seconds
+        and dp.intervals.prices == ds.points.prices
+    )
 
 
-@dataclass
-class Cache:
+@dataclass(frozen=True)
+class CacheSnapshot:
     today: DayPrices | None = None
     tomorrow: DayPrices | None = None
     last_refresh_utc: datetime | None = None
+    # Bumped on every change of today/tomorrow; derived caches key on it
+    generation: int = 0
+
+
+class Cache:
+    """Holds the current CacheSnapshot.
 
+    Snapshots are never modified; writers build the next one and swap it in
+    with a single assignment, so a reader that takes `snapshot` once per
+    request sees today and tomorrow from the same refresh.
+    """
+
+    def __init__(self) -> None:
+        self.snapshot = CacheSnapshot()
 
-cache = Cache()
+    def swap(self, **changes: t.Any) -> CacheSnapshot:
+        current = self.snapshot
+        changed = any(
+            changes.get(name, getattr(current, name)) is not getattr(current, name)
+            for name in ("today", "tomorrow")
+        )
+        self.snapshot = replace(
+            current,
+            **changes,
+            generation=current.generation + changed,
+        )
+        return self.snapshot
+
+
+# One live cache per served bidding zone
+caches: dict[str, Cache] = {code: Cache() for code in ENABLED_ZONES}
+
+
+def _local_today(zone: str) -> date:
+    return datetime.now(tz=get_zone(zone).tz).date()
 
 
 def _get_expected_intervals(granularity: t.Literal["hour", "quarter_hour"]) -> int:
@@ -88,68 +223,160 @@ class ProxyHeadersMiddleware(BaseHTTPMiddleware):
 def create_app() -> FastAPI:
     if not ENTSOE_API_TOKEN:
         raise RuntimeError("ENTSOE_API_TOKEN is required")
+    unknown = [code for code in caches if code not in ZONES]
+    if unknown or not caches:
+        raise RuntimeError(f"SPOT_ZONES must list known bidding zones: {unknown}")
+    default_zone = next(iter(caches))
 
     app = FastAPI(title="Spot is a dog")
     logger.info("Starting app: Spot is a dog")
     logger.info("Log level: %s", LOG_LEVEL)
     logger.info("Default margin (c/kWh): %s", DEFAULT_MARGIN_CENTS_PER_KWH)
+    logger.info("Bidding zones: %s", ", ".join(caches))
 
     app.add_middleware(GZipMiddleware, minimum_size=1024)
     app.add_middleware(ProxyHeadersMiddleware)
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
 
-    templates = Jinja2Templates(directory="templates")
+    # Templates are compiled once at startup; the bytecode cache lets other
+    # workers and restarts skip even that
+    template_env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader("templates"),
+        autoescape=True,
+        auto_reload=TEMPLATE_RELOAD,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(TEMPLATE_CACHE_DIR or None),
+    )
+    templates = Jinja2Templates(env=template_env)
+    for name in template_env.list_templates(extensions=["html"]):
+        template_env.get_template(name)
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
     @app.get("/healthz")
     async def healthz() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/readyz")
+    async def readyz() -> JSONResponse:
+        """Ready once every zone has today's prices; /healthz only reports liveness."""
+        zones: dict[str, dict[str, t.Any]] = {}
+        for zone, cache in caches.items():
+            today_d = _local_today(zone)
+            snap = cache.snapshot
+            last_refresh = snap.last_refresh_utc
+            zones[zone] = {
+                "warming": warming_up(zone),
+                "generation": snap.generation,
+                "today": snap.today is not None and snap.today.count(today_d) > 0,
+                "tomorrow": snap.tomorrow is not None
+                and snap.tomorrow.count(today_d + timedelta(days=1)) > 0,
+                "lastRefreshUtc": last_refresh.isoformat() if last_refresh else None,
+            }
+        ready = all(z["today"] for z in zones.values())
+        return JSONResponse(
+            {"status": "ready" if ready else "pending", "zones": zones},
+            status_code=200 if ready else 503,
+        )
+
     @app.get("/version")
     async def version() -> dict[str, str]:
         return {"version": os.environ.get("SPOT_VERSION", "dev")}
 
-    @app.get("/events/version")
-    async def version_events() -> StreamingResponse:
-        async def eventgen():
-            # Create a queue for this connection
-            event_queue = asyncio.Queue()
+    # Cache events for the browsers connected to this worker
+    event_hub = BroadcastHub()
 
-            # Register callback to receive cache events
-            async def on_cache_event(event_data):
-                await event_queue.put(event_data)
-
-            cache_event_callbacks.append(on_cache_event)
+    @app.get("/events/version")
+    async def version_events() -> Response:
+        queue = event_hub.subscribe()
+        if queue is None:
+            # Clients fall back to polling /version
+            return JSONResponse(
+                {"detail": "Too many event streams"},
+                status_code=503,
+                headers={"Retry-After": "60"},
+            )
 
+        async def eventgen() -> t.AsyncIterator[bytes]:
             try:
                 # Send initial version
                 ver = os.environ.get("SPOT_VERSION", "dev")
-                yield f'data: {{"type": "version", "version": "{ver}"}}\n\n'
+                yield encode_event({"type": "version", "version": ver})
 
                 while True:
                     try:
                         # Wait for cache events or timeout after 30 seconds
-                        event_data = await asyncio.wait_for(
-                            event_queue.get(),
-                            timeout=30.0,
-                        )
-                        yield f"data: {json.dumps(event_data)}\n\n"
+                        message = await asyncio.wait_for(queue.get(), timeout=30.0)
                     except TimeoutError:
                         # Send periodic version updates
                         ver = os.environ.get("SPOT_VERSION", "dev")
-                        yield f'data: {{"type": "version", "version": "{ver}"}}\n\n'
+                        yield encode_event({"type": "version", "version": ver})
+                        continue
+                    if message == CLOSED:
+                        # Fell behind and was dropped by the hub
+                        return
+                    yield message
             finally:
-                # Clean up callback when connection closes
-                if on_cache_event in cache_event_callbacks:
-                    cache_event_callbacks.remove(on_cache_event)
+                event_hub.unsubscribe(queue)
+
+        # The background task also releases the queue of a stream that is
+        # cancelled before it starts, when eventgen's finally never runs
+        return StreamingResponse(
+            eventgen(),
+            media_type="text/event-stream",
+            background=BackgroundTask(event_hub.unsubscribe, queue),
+        )
 
-        return StreamingResponse(eventgen(), media_type="text/event-stream")
+    from .entsoe import (
+        DataNotAvailable,
+        NotModified,
+        UpstreamUnavailable,
+        create_http_client,
+        fetch_day_ahead_price_range,
+        fetch_day_ahead_prices,
+    )
+
+    @app.exception_handler(UpstreamUnavailable)
+    async def upstream_unavailable(
+        _request: Request,
+        exc: UpstreamUnavailable,
+    ) -> JSONResponse:
+        # Fail fast while ENTSO-E is down instead of holding the request open
+        return JSONResponse(
+            {"detail": "Price data source temporarily unavailable"},
+            status_code=503,
+            headers={"Retry-After": str(int(exc.retry_after))},
+        )
 
-    from .entsoe import DataNotAvailable, fetch_day_ahead_prices
+    def resolve_zone(zone: str | None) -> str:
+        if not zone:
+            return default_zone
+        if zone.upper() not in caches:
+            raise HTTPException(status_code=404, detail=f"Unknown zone: {zone}")
+        return zone.upper()
+
+    async def fetch_prices_for_day(
+        zone: str,
+        target_date: date,
+        known_digest: str | None = None,
+    ) -> DayPrices:
+        store: PriceStore | None = app.state.price_store
+        # A refetch with a known digest is looking for changes, so skip the store
+        if store is not None and known_digest is None:
+            try:
+                stored = await asyncio.to_thread(store.load, zone, target_date)
+            except sqlite3.Error:
+                logger.exception(
+                    f"Reading stored {zone} prices for {target_date} failed",
+                )
+                stored = None
+            if stored is not None:
+                logger.info(
+                    f"Using stored {stored.granularity} {zone} prices for {target_date}",
+                )
+                return _day_prices(stored)
 
-    async def fetch_prices_for_day(target_date: date) -> DayPrices:
+        zone_tz = get_zone(zone).tz
         logger.info(
-            f"Fetching prices for date: {target_date} (Helsinki time: {datetime.now(tz=HELSINKI_TZ)})",
+            f"Fetching {zone} prices for date: {target_date} (local time: {datetime.now(tz=zone_tz)})",
         )
         # Try 15-minute resolution first for dates after Oct 1, 2025
         # For testing: enable 15-minute simulation for current dates
@@ -160,23 +387,112 @@ def create_app() -> FastAPI:
             ENTSOE_API_TOKEN,
             target_date,
             prefer_15min=prefer_15min,
+            client=app.state.http_client,
+            known_digest=known_digest,
+            zone=zone,
         )
-        intervals = [
-            PriceInterval(p.start_utc, p.end_utc, p.price_eur_per_mwh)
-            for p in ds.points
-        ]
+        intervals = ds.points
         logger.info(
-            f"Fetched {len(intervals)} intervals ({ds.granularity}) for {target_date}, first interval: {intervals[0].start_utc.astimezone(HELSINKI_TZ) if intervals else 'None'}",
+            f"Fetched {len(intervals)} intervals ({ds.granularity}) for {zone} {target_date}, first interval: {intervals.start_utc.astimezone(zone_tz) if intervals else 'None'}",
         )
-        return DayPrices(
-            market=ds.market,
-            granularity=ds.granularity,
-            intervals=intervals,
-            published_at_utc=ds.published_at_utc,
+        dp = _day_prices(ds)
+        # The response also covers neighbouring days; store only the requested one
+        if store is not None and dp.count(target_date):
+            day = replace(ds, points=dp.day(target_date))
+            try:
+                await asyncio.to_thread(store.save, zone, target_date, day)
+            except sqlite3.Error:
+                logger.exception(f"Storing {zone} prices for {target_date} failed")
+        return dp
+
+    histories: dict[str, DayCache[DayPrices]] = {
+        zone: DayCache(HISTORY_CAPACITY) for zone in caches
+    }
+    # Encoded JSON bodies, valid while the zone's cache generation is unchanged
+    response_caches: dict[str, ResponseCache] = {
+        zone: ResponseCache(RESPONSE_CACHE_BYTES // len(caches)) for zone in caches
+    }
+
+    # Zones whose today's prices startup has loaded at least once
+    warmed: set[str] = set()
+
+    def warming_up(zone: str) -> bool:
+        return caches[zone].snapshot.today is None and zone not in warmed
+
+    def pending_response() -> JSONResponse:
+        return JSONResponse(
+            {"status": "pending", "detail": "Price data pending"},
+            status_code=503,
+            headers={"Retry-After": str(PENDING_RETRY_SECONDS)},
         )
 
-    # Cache event callbacks for notifying browsers
-    cache_event_callbacks = []
+    def cacheable_response(dp: DayPrices | None, snap: CacheSnapshot) -> bool:
+        # Live days are covered by the generation; history days by their
+        # digest, so responses built from a failed fetch are never kept
+        if dp is None:
+            return False
+        return dp is snap.today or dp is snap.tomorrow or bool(dp.content_digest)
+
+    # Background revalidations by key, at most one running per key
+    revalidations: dict[t.Hashable, asyncio.Task[None]] = {}
+
+    def revalidate(
+        key: t.Hashable,
+        refresh: t.Callable[[], t.Coroutine[t.Any, t.Any, None]],
+    ) -> None:
+        if key in revalidations:
+            return
+        task = asyncio.create_task(refresh())
+        revalidations[key] = task
+        task.add_done_callback(lambda _: revalidations.pop(key, None))
+
+    async def revalidate_live(zone: str) -> None:
+        try:
+            await ensure_cache_now(zone)
+        except Exception:
+            logger.exception(f"Background revalidation of {zone} today/tomorrow failed")
+
+    def check_live_cache(zone: str, snap: CacheSnapshot) -> bool:
+        """Whether `snap` is stale; if so, start revalidating the zone's cache."""
+        today_d = _local_today(zone)
+        last = snap.last_refresh_utc
+        stale = (
+            snap.today is None
+            or snap.today.count(today_d) == 0
+            or last is None
+            or (datetime.now(UTC) - last).total_seconds() > STALE_AFTER_SECONDS
+        )
+        if stale and not warming_up(zone):
+            revalidate(("live", zone), lambda: revalidate_live(zone))
+        return stale
+
+    async def cached_prices_for_day(
+        zone: str,
+        target: date,
+        snap: CacheSnapshot,
+    ) -> tuple[DayPrices | None, bool]:
+        """Prices for any day and whether they are stale.
+
+        Today and tomorrow come from `snap` only, or None while they
+        are missing. Other days come from the history cache; days never
+        seen before wait for the store or upstream.
+        """
+        today_d = _local_today(zone)
+        live_stale = check_live_cache(zone, snap)
+        for live in (snap.today, snap.tomorrow):
+            if live is not None and live.count(target):
+                return live, live_stale
+        if target in (today_d, today_d + timedelta(days=1)):
+            return None, live_stale
+
+        history = histories[zone]
+        dp = history.get(target)
+        if dp is not None:
+            logger.debug(f"History cache hit for {zone} {target}")
+            return dp, False
+        dp = await fetch_prices_for_day(zone, target)
+        history.put(target, dp)
+        return dp, False
 
     async def notify_cache_event(event_type: str, data: dict | None = None):
         """Notify all connected browsers about cache events"""
@@ -184,214 +500,278 @@ def create_app() -> FastAPI:
         if data:
             event_data.update(data)
 
-        logger.info(
-            f"Sending cache event to {len(cache_event_callbacks)} clients: {event_type}",
+        shared: SharedState | None = app.state.shared
+        if shared is not None and shared.leader:
+            # Other workers replay the event for their own SSE clients
+            shared.record_event(event_data)
+            publish_snapshot(shared)
+        deliver_cache_event(event_data)
+
+    def deliver_cache_event(event_data: dict) -> None:
+        event_type = event_data["type"]
+        logger.info(f"Sending cache event to {len(event_hub)} clients: {event_type}")
+        # Only queues the encoded event; never waits for a client
+        event_hub.publish(event_data)
+
+    async def _skip_fetch() -> None:
+        return None
+
+    # Concurrent refreshes (page loads, chart requests, polling and midnight
+    # loops) share one in-flight run instead of each calling ENTSO-E
+    cache_refreshes: SingleFlight[str, None] = SingleFlight()
+
+    async def ensure_cache_now(zone: str) -> None:
+        shared: SharedState | None = app.state.shared
+        if shared is not None and not shared.leader:
+            # Only the worker holding the poller lock talks to ENTSO-E
+            await follow_snapshot(shared)
+            return
+        await cache_refreshes.run(zone, lambda: _refresh_cache(zone))
+        if shared is not None:
+            publish_snapshot(shared)
+
+    async def ensure_all_caches_now() -> None:
+        """One refresh round over every zone; failures are logged per zone."""
+        results = await asyncio.gather(
+            *(ensure_cache_now(zone) for zone in caches),
+            return_exceptions=True,
         )
+        failures = 0
+        for zone, result in zip(caches, results, strict=True):
+            if isinstance(result, Exception):
+                failures += 1
+                logger.error(f"Refreshing {zone} prices failed: {result}")
+        if failures == len(caches):
+            raise RuntimeError("Refreshing prices failed for every zone")
+
+    def publish_snapshot(shared: SharedState) -> None:
+        days: dict[str, DaySeries] = {}
+        refreshed: dict[str, datetime] = {}
+        for zone, cache in caches.items():
+            snap = cache.snapshot
+            for name, dp in (("today", snap.today), ("tomorrow", snap.tomorrow)):
+                if dp is not None:
+                    days[f"{zone}/{name}"] = _day_series(dp)
+            if snap.last_refresh_utc is not None:
+                refreshed[zone] = snap.last_refresh_utc
+        try:
+            shared.publish(days, refreshed)
+        except OSError:
+            logger.exception("Publishing the shared price snapshot failed")
 
-        # Call all registered callbacks (WebSocket/SSE connections)
-        for callback in cache_event_callbacks[
-            :
-        ]:  # Copy list to avoid modification during iteration
-            try:
-                await callback(event_data)
-            except Exception as e:
-                logger.warning(f"Failed to notify cache event callback: {e}")
-                # Remove failed callbacks
-                cache_event_callbacks.remove(callback)
-
-    async def ensure_cache_now() -> None:
+    async def follow_snapshot(shared: SharedState) -> None:
+        """Load the poller's latest snapshot and pass on its new events."""
+        try:
+            snapshot = shared.poll()
+        except (OSError, ValueError):
+            logger.exception("Reading the shared price snapshot failed")
+            return
+        if snapshot is None:
+            return
+        for zone, cache in caches.items():
+            current = cache.snapshot
+            changes: dict[str, t.Any] = {
+                "last_refresh_utc": snapshot.last_refresh_utc.get(zone),
+            }
+            for name in ("today", "tomorrow"):
+                ds = snapshot.days.get(f"{zone}/{name}")
+                # Replacing a day bumps the generation, so only replace what changed
+                if not _same_prices(getattr(current, name), ds):
+                    changes[name] = _day_prices(ds) if ds is not None else None
+            if cache.swap(**changes).today is not None:
+                warmed.add(zone)
+        for event_data in shared.unseen_events(snapshot):
+            deliver_cache_event(event_data)
+
+    async def _refresh_cache(zone: str) -> None:
         # Minimal: populate today and attempt tomorrow
-        now_hel = datetime.now(tz=HELSINKI_TZ)
-        today_d = now_hel.date()
+        now_local = datetime.now(tz=get_zone(zone).tz)
+        today_d = now_local.date()
         logger.info(
-            f"ensure_cache_now() called for {today_d} at Helsinki time {now_hel}",
+            f"ensure_cache_now({zone}) called for {today_d} at local time {now_local}",
         )
 
-        # Check if we need to rotate cache at midnight or clean up contaminated data
-        cache_rotated = False
-        if cache.today is not None:
-            # Debug: Check what dates are actually in today's cache
-            today_dates = set()
-            for it in cache.today.intervals:
-                interval_date = it.start_utc.astimezone(HELSINKI_TZ).date()
-                today_dates.add(interval_date)
-
-            logger.info(
-                f"Midnight rotation debug: today_d={today_d}, today cache contains dates: {sorted(today_dates)}",
-            )
+        # Work on locals and swap in one new snapshot at the end, so readers
+        # never see a half-rotated cache
+        cache = caches[zone]
+        snap = cache.snapshot
+        today_dp, tomorrow_dp = snap.today, snap.tomorrow
+        events: list[tuple[str, dict]] = []
+        tomorrow_error: BaseException | None = None
 
-            # Check if cached "today" data contains the right date
-            today_intervals = [
-                it
-                for it in cache.today.intervals
-                if it.start_utc.astimezone(HELSINKI_TZ).date() == today_d
-            ]
-            total_intervals = len(cache.today.intervals)
+        # Check if we need to rotate cache at midnight or clean up contaminated data
+        if today_dp is not None:
+            today_count = today_dp.count(today_d)
+            total_intervals = len(today_dp.intervals)
             logger.info(
-                f"Today cache: {len(today_intervals)}/{total_intervals} intervals match {today_d}",
+                f"Today cache: {today_count}/{total_intervals} intervals match {today_d}, cache contains dates: {sorted(today_dp.day_index)}",
             )
 
             # If cache is contaminated (contains wrong dates) or empty for today, fix it
-            if len(today_intervals) == 0:
+            if today_count == 0:
                 # No intervals for today - try to rotate from tomorrow
-                if cache.tomorrow is not None:
-                    # Debug: Check what dates are actually in tomorrow's cache
-                    tomorrow_dates = set()
-                    for it in cache.tomorrow.intervals:
-                        interval_date = it.start_utc.astimezone(HELSINKI_TZ).date()
-                        tomorrow_dates.add(interval_date)
-
+                if tomorrow_dp is not None:
+                    rotated = tomorrow_dp.day(today_d)
                     logger.info(
-                        f"Midnight rotation debug: today_d={today_d}, tomorrow cache contains dates: {sorted(tomorrow_dates)}",
+                        f"Tomorrow intervals matching {today_d}: {len(rotated)} out of {len(tomorrow_dp.intervals)} total, cache contains dates: {sorted(tomorrow_dp.day_index)}",
                     )
-
-                    tomorrow_intervals = [
-                        it
-                        for it in cache.tomorrow.intervals
-                        if it.start_utc.astimezone(HELSINKI_TZ).date() == today_d
-                    ]
-                    logger.info(
-                        f"Tomorrow intervals matching {today_d}: {len(tomorrow_intervals)} out of {len(cache.tomorrow.intervals)} total",
-                    )
-                    if tomorrow_intervals:
+                    if rotated:
                         logger.info(
                             f"Midnight transition: rotating tomorrow's cache to today ({today_d})",
                         )
-                        # Create clean cache with only today's intervals
-                        cache.today = replace(
-                            cache.tomorrow,
-                            intervals=tomorrow_intervals,
-                        )
-                        cache.tomorrow = None
-                        cache_rotated = True
-                        await notify_cache_event(
-                            "cache_rotated",
-                            {"new_today": today_d.isoformat()},
+                        # Keep only today's intervals
+                        today_dp = replace(tomorrow_dp, intervals=rotated)
+                        tomorrow_dp = None
+                        events.append(
+                            ("cache_rotated", {"new_today": today_d.isoformat()}),
                         )
                     else:
                         logger.warning(
                             f"No tomorrow intervals match today's date {today_d}",
                         )
-                        cache.today = None  # Clear contaminated cache
+                        today_dp = None  # Clear contaminated cache
                 else:
                     logger.warning(
                         "No today intervals and no tomorrow cache to rotate from",
                     )
-                    cache.today = None  # Clear contaminated cache
-            elif len(today_intervals) != total_intervals:
+                    today_dp = None  # Clear contaminated cache
+            elif today_count != total_intervals:
                 # Cache is contaminated with intervals from other dates - clean it
                 logger.info(
-                    f"Cleaning contaminated today cache: keeping {len(today_intervals)}/{total_intervals} intervals for {today_d}",
+                    f"Cleaning contaminated today cache: keeping {today_count}/{total_intervals} intervals for {today_d}",
                 )
-                cache.today = replace(cache.today, intervals=today_intervals)
+                today_dp = replace(today_dp, intervals=today_dp.day(today_d))
             else:
                 logger.debug(
-                    f"Today cache is clean: {len(today_intervals)} intervals for {today_d}",
+                    f"Today cache is clean: {today_count} intervals for {today_d}",
                 )
 
         # Check if we need to fetch today's data
-        need_today = True
-        if cache.today is not None:
-            # Check if any interval in cached data matches today's date
-            for interval in cache.today.intervals:
-                interval_date = interval.start_utc.astimezone(HELSINKI_TZ).date()
-                if interval_date == today_d:
-                    need_today = False
-                    break
-
-        if need_today:
-            logger.info("Cache miss: Fetching today's prices for %s", today_d)
-            try:
-                cache.today = await fetch_prices_for_day(today_d)
-                logger.info(
-                    "Successfully cached today's prices (%d intervals)",
-                    len(cache.today.intervals),
-                )
-                await notify_cache_event("today_updated", {"date": today_d.isoformat()})
-            except DataNotAvailable as e:
-                logger.warning(
-                    "Today's prices not available yet for %s: %s; will retry",
-                    today_d,
-                    e,
-                )
-                cache.today = None
-            except Exception as e:
-                logger.error("Failed to fetch today's prices for %s: %s", today_d, e)
-                cache.today = None
-        else:
-            logger.info(
-                "Cache hit: Using cached today's prices (%d intervals)",
-                len(cache.today.intervals),
-            )
+        need_today = today_dp is None or today_dp.count(today_d) == 0
 
         # Check if we need to fetch tomorrow's data (either missing or incomplete)
         need_tomorrow = False
         tomorrow_d = today_d + timedelta(days=1)
 
-        if cache.tomorrow is None:
+        if tomorrow_dp is None:
             need_tomorrow = True
             logger.debug("Cache miss: No tomorrow data cached")
         else:
-            # Check if tomorrow data is complete (all 24 hours)
-            tomorrow_intervals = [
-                it
-                for it in cache.tomorrow.intervals
-                if it.start_utc.astimezone(HELSINKI_TZ).date() == tomorrow_d
-            ]
             # Check if tomorrow data is complete based on granularity
-            expected_intervals = _get_expected_intervals(cache.tomorrow.granularity)
-            if len(tomorrow_intervals) < expected_intervals:
+            tomorrow_count = tomorrow_dp.count(tomorrow_d)
+            expected_intervals = _get_expected_intervals(tomorrow_dp.granularity)
+            if tomorrow_count < expected_intervals:
                 need_tomorrow = True
                 logger.info(
                     "Incomplete tomorrow data: only %d/%d intervals cached, refetching",
-                    len(tomorrow_intervals),
+                    tomorrow_count,
                     expected_intervals,
                 )
 
+        # Fetch both days concurrently rather than one after the other
+        if need_today:
+            logger.info("Cache miss: Fetching today's prices for %s", today_d)
         if need_tomorrow:
             logger.debug("Attempting to fetch tomorrow's prices for %s", tomorrow_d)
-            try:
-                cache.tomorrow = await fetch_prices_for_day(tomorrow_d)
-                logger.info(
-                    "Successfully cached tomorrow's prices (%d intervals)",
-                    len(cache.tomorrow.intervals),
-                )
-                await notify_cache_event(
-                    "tomorrow_updated",
-                    {"date": tomorrow_d.isoformat()},
-                )
-            except DataNotAvailable:
-                logger.debug("Tomorrow's prices not available yet")
-                # Don't clear existing partial data - keep what we have
+        today_result, tomorrow_result = await asyncio.gather(
+            fetch_prices_for_day(zone, today_d) if need_today else _skip_fetch(),
+            fetch_prices_for_day(
+                zone,
+                tomorrow_d,
+                known_digest=tomorrow_dp.content_digest if tomorrow_dp else None,
+            )
+            if need_tomorrow
+            else _skip_fetch(),
+            return_exceptions=True,
+        )
+
+        if not need_today:
+            logger.info(
+                "Cache hit: Using cached today's prices (%d intervals)",
+                len(today_dp.intervals),
+            )
+        elif isinstance(today_result, DataNotAvailable):
+            logger.warning(
+                "Today's prices not available yet for %s: %s; will retry",
+                today_d,
+                today_result,
+            )
+            today_dp = None
+        elif isinstance(today_result, BaseException):
+            logger.error(
+                "Failed to fetch today's prices for %s: %s",
+                today_d,
+                today_result,
+            )
+            today_dp = None
         else:
+            today_dp = today_result
+            logger.info(
+                "Successfully cached today's prices (%d intervals)",
+                len(today_dp.intervals),
+            )
+            events.append(("today_updated", {"date": today_d.isoformat()}))
+
+        if not need_tomorrow:
             logger.info(
                 "Cache hit: Using cached tomorrow's prices (%d intervals)",
-                len(cache.tomorrow.intervals),
+                len(tomorrow_dp.intervals),
+            )
+        elif isinstance(tomorrow_result, NotModified):
+            logger.debug("Tomorrow's prices unchanged since last fetch")
+        elif isinstance(tomorrow_result, DataNotAvailable):
+            logger.debug("Tomorrow's prices not available yet")
+            # Don't clear existing partial data - keep what we have
+        elif isinstance(tomorrow_result, UpstreamUnavailable):
+            logger.warning("Skipping tomorrow's prices fetch: %s", tomorrow_result)
+            # Raised below so the polling loop backs off while ENTSO-E fails
+            tomorrow_error = tomorrow_result
+        elif isinstance(tomorrow_result, BaseException):
+            # Raised below, once today's result is in the cache
+            tomorrow_error = tomorrow_result
+        else:
+            tomorrow_dp = tomorrow_result
+            logger.info(
+                "Successfully cached tomorrow's prices (%d intervals)",
+                len(tomorrow_dp.intervals),
             )
+            events.append(("tomorrow_updated", {"date": tomorrow_d.isoformat()}))
 
-        cache.last_refresh_utc = datetime.now(UTC)
+        cache.swap(
+            today=today_dp,
+            tomorrow=tomorrow_dp,
+            last_refresh_utc=datetime.now(UTC),
+        )
+        for event_type, data in events:
+            await notify_cache_event(event_type, {"zone": zone, **data})
+        if tomorrow_error is not None:
+            raise tomorrow_error
 
     @app.get("/", response_class=HTMLResponse)
     async def home(
         request: Request,
         margin: float | None = Query(default=None),
+        zone: str | None = Query(default=None),
     ) -> HTMLResponse:
+        zone_code = resolve_zone(zone)
         # If no margin parameter provided, redirect to show default margin in URL
         if margin is None:
             from fastapi.responses import RedirectResponse
 
             redirect_url = f"/?margin={DEFAULT_MARGIN_CENTS_PER_KWH:.2f}"
+            if zone is not None:
+                redirect_url += f"&zone={zone_code}"
             return RedirectResponse(url=redirect_url, status_code=302)
 
         # Validate margin parameter
         margin = validate_margin(margin)
 
-        # Only ensure cache if it's not already populated (avoid delays on first page load)
-        if cache.today is None:
-            logger.info("Cache not warmed up yet, ensuring cache for first page load")
-            await ensure_cache_now()
-        else:
-            logger.debug("Cache already warm, serving page immediately")
+        # Never wait for ENTSO-E here: while startup is still warming the
+        # cache the chart placeholders poll until prices are available
+        if warming_up(zone_code):
+            logger.info("Cache not warmed up yet, serving page with placeholders")
+        elif check_live_cache(zone_code, caches[zone_code].snapshot):
+            logger.info("Serving page while the price cache revalidates")
 
         return templates.TemplateResponse(
             "index.html",
@@ -399,19 +779,54 @@ def create_app() -> FastAPI:
                 "request": request,
                 "app_name": "Spot is a dog",
                 "margin_cents": margin,
+                "zone": zone_code,
                 "app_version": os.environ.get("SPOT_VERSION", "dev"),
             },
         )
 
     @app.get("/api/prices", response_class=JSONResponse)
-    async def api_prices(date_str: str) -> JSONResponse:
+    async def api_prices(
+        date_str: str,
+        granularity: Granularity | None = Query(default=None),
+        agg: Aggregation = Query(default="mean"),
+        zone: str | None = Query(default=None),
+    ) -> Response:
+        zone_code = resolve_zone(zone)
         target = datetime.fromisoformat(date_str).date()
-        logger.debug("/api/prices date=%s", target)
-        dp = await fetch_prices_for_day(target)
-        return JSONResponse(
+        logger.debug(
+            "/api/prices zone=%s date=%s granularity=%s",
+            zone_code,
+            target,
+            granularity,
+        )
+        if warming_up(zone_code) and target >= _local_today(zone_code):
+            return pending_response()
+        snap = caches[zone_code].snapshot
+        dp, stale = await cached_prices_for_day(zone_code, target, snap)
+        if dp is None:
+            # Not published yet, or being refetched in the background
+            return pending_response()
+        if granularity is None:
+            granularity = dp.granularity
+
+        responses = response_caches[zone_code]
+        key = ("prices", target, granularity, agg, dp.content_digest, stale)
+        generation = snap.generation
+        body = responses.get(key, generation)
+        if body is not None:
+            return Response(body, media_type="application/json")
+
+        # The cached series may span neighbouring days too
+        day = dp.day(target)
+        if granularity == "day":
+            points = resample_daily(day, get_zone(zone_code).tz, agg)
+        else:
+            points = resample(day, STEP_SECONDS[granularity], agg)
+        response = JSONResponse(
             {
                 "market": dp.market,
-                "granularity": dp.granularity,
+                "granularity": granularity,
+                "stale": stale,
                 "intervals": [
                     {
                         "startTimeUtc": it.start_utc.isoformat(),
@@ -420,107 +835,124 @@ def create_app() -> FastAPI:
                         "priceCurrency": "EUR",
                         "unit": "MWh",
                     }
-                    for it in dp.intervals
+                    for it in points
                 ],
             },
         )
+        if cacheable_response(dp, snap):
+            responses.put(key, generation, response.body)
+        return response
 
-    async def calculate_global_price_range(margin_cents: float) -> tuple[float, float]:
-        """Calculate global min/max price range for consistent chart scaling"""
-
-        global_max = float("-inf")
-        global_min = float("inf")
-
-        # Cache should already be populated from startup
-        if cache.today is None:
-            logger.warning(
-                "Cache not warm during price range calculation, ensuring cache",
-            )
-            await ensure_cache_now()
-
-        datasets_checked = 0
-        intervals_processed = 0
-
-        # Check both today and tomorrow data for global range
-        for name, dp in [("today", cache.today), ("tomorrow", cache.tomorrow)]:
-            if dp is None:
-                logger.debug(f"No data for {name}")
-                continue
-
-            datasets_checked += 1
-            logger.debug(f"Processing {name} data with {len(dp.intervals)} intervals")
-
-            for it in dp.intervals:
-                # Convert EUR/MWh to cents/kWh (with VAT included)
-                spot_cents_with_vat = eur_mwh_to_cents_kwh(it.price_eur_per_mwh)
-
-                # Calculate the total price (spot + margin) that will be displayed
-                total_price = spot_cents_with_vat + margin_cents
-
-                # Debug logging for scaling investigation
-                if (
-                    intervals_processed < 5 or total_price > global_max
-                ):  # Log first few and any new maximums
-                    logger.debug(
-                        f"Price interval {intervals_processed}: spot={spot_cents_with_vat:.2f}, total={total_price:.2f} (margin={margin_cents:.2f})",
-                    )
-
-                # Track the actual range of total prices
-                global_max = max(global_max, total_price)
-                global_min = min(
-                    global_min,
-                    spot_cents_with_vat,
-                )  # Spot price can be negative, margin is always added on top
-
-                intervals_processed += 1
-
-        logger.debug(
-            f"Processed {datasets_checked} datasets, {intervals_processed} intervals",
-        )
-
-        # If no data found, use reasonable defaults
-        if global_min == float("inf") or global_max == float("-inf"):
-            logger.warning(
-                "No price data found for global range calculation, using defaults",
+    @app.get("/api/export")
+    async def api_export(
+        start: date,
+        end: date,
+        fmt: ExportFormat = Query(default="csv", alias="format"),
+        zone: str | None = Query(default=None),
+    ) -> StreamingResponse:
+        """Stream the intervals of the local days [start, end] as CSV or NDJSON.
+
+        Days come from the cache or the store; only days in neither are
+        fetched from ENTSO-E, one range request per run of consecutive
+        missing days, before the response starts.
+        """
+        zone_code = resolve_zone(zone)
+        if end < start:
+            raise HTTPException(status_code=400, detail="end is before start")
+        if (end - start).days + 1 > EXPORT_MAX_DAYS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {EXPORT_MAX_DAYS} days per export",
             )
-            global_min = 0.0
-            global_max = 25.0
-
-        # Round to 5-cent increments with minimum of 15 cents
-        # Maximum: always at least 15 cents, or round UP to next 5 cents above highest price
-        if global_max <= 0:
-            max_price_rounded = 15  # Minimum scale of 15 cents
-        else:
-            # Calculate rounded price based on actual max
-            if global_max % 5 == 0:
-                calculated_max = int(global_max) + 5
+        # Nothing is published beyond tomorrow
+        end = min(end, _local_today(zone_code) + timedelta(days=1))
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+        snap = caches[zone_code].snapshot
+        history = histories[zone_code]
+        store: PriceStore | None = app.state.price_store
+
+        def cached_day(day: date) -> PriceSeries | None:
+            for dp in (snap.today, snap.tomorrow, history.peek(day)):
+                if dp is not None and dp.count(day):
+                    return dp.day(day)
+            return None
+
+        stored: set[date] = set()
+        if store is not None and days:
+            try:
+                stored = await asyncio.to_thread(
+                    store.stored_days,
+                    zone_code,
+                    start,
+                    end,
+                )
+            except sqlite3.Error:
+                logger.exception(f"Listing stored {zone_code} prices failed")
+        missing = [d for d in days if d not in stored and cached_day(d) is None]
+        # One range request per run of consecutive missing days, so days
+        # already stored or cached between runs are not fetched again
+        runs: list[tuple[date, date]] = []
+        for day in missing:
+            if runs and runs[-1][1] == day:
+                runs[-1] = (runs[-1][0], day + timedelta(days=1))
             else:
-                calculated_max = ((int(global_max) // 5) + 1) * 5
-
-            # Ensure minimum of 15 cents
-            max_price_rounded = max(15, calculated_max)
-
-        # Minimum: round DOWN to next 1 cent below lowest price, or 0 for positive prices
-        if global_min >= 0:
-            min_price_rounded = 0  # Start from 0 for positive prices
-        else:
-            # For negative prices, round down to next 1-cent boundary
-            import math
+                runs.append((day, day + timedelta(days=1)))
+        fetched: dict[date, DaySeries] = {}
+        if runs and ENTSOE_API_TOKEN:
+            for run_start, run_end in runs:
+                fetched |= await fetch_day_ahead_price_range(
+                    ENTSOE_API_TOKEN,
+                    run_start,
+                    run_end,
+                    client=app.state.http_client,
+                    zone=zone_code,
+                )
+            if store is not None:
+                try:
+                    for day, ds in fetched.items():
+                        await asyncio.to_thread(store.save, zone_code, day, ds)
+                except sqlite3.Error:
+                    logger.exception(f"Storing exported {zone_code} prices failed")
+
+        async def encoded_days() -> t.AsyncIterator[bytes]:
+            # One chunk per day, so only one day is held in memory at a time
+            yield export_header(fmt)
+            for day in days:
+                series = cached_day(day)
+                if series is None and day in fetched:
+                    series = fetched.pop(day).points
+                if series is None and store is not None and day in stored:
+                    ds = await asyncio.to_thread(store.load, zone_code, day)
+                    # Rows stored before single-day fetches were sliced may
+                    # span neighbouring days
+                    series = _day_prices(ds).day(day) if ds is not None else None
+                if series is not None:
+                    yield export_rows(series, fmt)
+
+        filename = f"spot-{zone_code}-{start}-{end}.{fmt}"
+        return StreamingResponse(
+            encoded_days(),
+            media_type=MEDIA_TYPES[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
 
-            if global_min % 1 == 0:
-                min_price_rounded = int(global_min) - 1
-            else:
-                min_price_rounded = math.floor(global_min)
+    def calculate_global_price_range(
+        margin_cents: float,
+        snap: CacheSnapshot,
+    ) -> tuple[float, float]:
+        """Calculate global min/max price range for consistent chart scaling"""
 
-        logger.info(
-            f"Global price range: {global_min:.2f} -> {global_max:.2f}, rounded: {min_price_rounded} -> {max_price_rounded} (margin: {margin_cents:.3f})",
-        )
-        logger.info(
-            f"Y-axis range calculation: min={global_min:.2f} -> {min_price_rounded}, max={global_max:.2f} -> {max_price_rounded}",
-        )
-        logger.debug(
-            f"Scaling calculation details: datasets={datasets_checked}, intervals={intervals_processed}",
+        # Whatever `snap` holds; a missing day only widens the default range
+        # until revalidation fills it
+        global_min, global_max, min_price_rounded, max_price_rounded = price_range(
+            [dp.extrema for dp in (snap.today, snap.tomorrow) if dp],
+            margin_cents,
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Global price range: {global_min:.2f} -> {global_max:.2f}, rounded: {min_price_rounded} -> {max_price_rounded} (margin: {margin_cents:.3f})",
+            )
 
         return min_price_rounded, max_price_rounded
 
@@ -528,8 +960,21 @@ def create_app() -> FastAPI:
     async def api_chart_data(
         date_str: str,
         margin: float | None = Query(default=None),
-    ) -> JSONResponse:
-        """API endpoint that provides data in Google Charts format like the Angular component"""
+        granularity: Granularity | None = Query(default=None),
+        zone: str | None = Query(default=None),
+        fmt: ChartFormat = Query(default="rows", alias="format"),
+        encoding: ChartEncoding = Query(default="json"),
+    ) -> Response:
+        """API endpoint that provides data in Google Charts format like the Angular component
+
+        With format=compact the rows are replaced by the spot prices of the
+        priced slots, plus the margin and band thresholds once; the client
+        rebuilds the rows. encoding=f32 sends those prices as base64 float32.
+        """
+        zone_code = resolve_zone(zone)
+        if warming_up(zone_code):
+            # The global price range needs today's prices
+            return pending_response()
         try:
             margin_cents = (
                 margin if margin is not None else DEFAULT_MARGIN_CENTS_PER_KWH
@@ -538,17 +983,18 @@ def create_app() -> FastAPI:
             if margin is not None:
                 margin_cents = validate_margin(margin_cents)
 
-            # Handle special date strings and convert to actual dates in Helsinki timezone
-            now_hel = datetime.now(tz=HELSINKI_TZ)
+            # Handle special date strings and convert to actual dates in the
+            # zone's time zone
+            now_local = datetime.now(tz=get_zone(zone_code).tz)
             if date_str == "today":
-                target = now_hel.date()
+                target = now_local.date()
                 logger.debug(
                     "/api/chart-data date=today (%s) margin=%.3f",
                     target,
                     margin_cents,
                 )
             elif date_str == "tomorrow":
-                target = (now_hel + timedelta(days=1)).date()
+                target = (now_local + timedelta(days=1)).date()
                 logger.debug(
                     "/api/chart-data date=tomorrow (%s) margin=%.3f",
                     target,
@@ -562,155 +1008,59 @@ def create_app() -> FastAPI:
                     margin_cents,
                 )
 
-            # Get all available data from cache first (cache should be warm from startup)
-            # But also check if cache contains stale data (e.g., after midnight)
-            cache_needs_refresh = False
-            if cache.today is None:
-                logger.warning(
-                    "Cache not warm during chart data request, ensuring cache"
-                )
-                cache_needs_refresh = True
-            else:
-                # Check if today's cache contains data for the current date
-                today_date = now_hel.date()
-                today_intervals_for_current_date = [
-                    it
-                    for it in cache.today.intervals
-                    if it.start_utc.astimezone(HELSINKI_TZ).date() == today_date
-                ]
-                if len(today_intervals_for_current_date) == 0:
-                    logger.warning(
-                        f"Today's cache contains no data for current date {today_date}, ensuring cache",
-                    )
-                    cache_needs_refresh = True
-                else:
-                    logger.debug("Using warm cache for chart data")
-
-            if cache_needs_refresh:
-                await ensure_cache_now()
+            # Served from memory, stale or not; refreshes run in the background.
+            # One snapshot for the whole request keeps the day and the price
+            # range consistent
+            snap = caches[zone_code].snapshot
+            responses = response_caches[zone_code]
+            try:
+                dp, stale = await cached_prices_for_day(zone_code, target, snap)
+            except Exception as e:
+                logger.error(f"Failed to fetch data for {target}: {e}")
+                dp, stale = None, False
+            if stale:
+                logger.info(f"Serving stale chart data for {target}")
+
+            key = ("chart-data", target, margin_cents, granularity, stale)
+            key += (fmt, encoding)
+            if dp is not None:
+                key += (dp.content_digest,)
+            generation = snap.generation
+            body = responses.get(key, generation)
+            if body is not None:
+                return Response(body, media_type="application/json")
 
             # Calculate global price range for consistent scaling
-            global_min_price, global_max_price = await calculate_global_price_range(
+            global_min_price, global_max_price = calculate_global_price_range(
                 margin_cents,
+                snap,
             )
 
-            # Determine which data to use based on the requested date
-            now_hel = datetime.now(tz=HELSINKI_TZ)
-            today_date = now_hel.date()
-            tomorrow_date = today_date + timedelta(days=1)
-
-            # Use cache data directly - cache should already be populated by ensure_cache_now()
-            dp = None
-            if target == today_date and cache.today:
-                logger.debug(f"Using today's cache for {target}")
-                dp = cache.today
-            elif target == tomorrow_date and cache.tomorrow:
-                logger.debug(f"Using tomorrow's cache for {target}")
-                dp = cache.tomorrow
-            else:
-                # Only fetch directly if not today/tomorrow or cache miss
-                logger.warning(
-                    f"Cache miss for {target}, fetching directly from ENTSO-E",
-                )
-                try:
-                    dp = await fetch_prices_for_day(target)
-                except Exception as e:
-                    logger.error(f"Failed to fetch data for {target}: {e}")
-                    dp = None
-
-            LOW_PRICE = 5.0  # cents/kWh
-            HIGH_PRICE = 15.0  # cents/kWh
-
-            chart_data = []
-
-            # Process all intervals and filter by target date in Helsinki timezone
-            if dp and dp.intervals:
-                for it in dp.intervals:
-                    # Convert to Helsinki timezone
-                    start_helsinki = it.start_utc.astimezone(HELSINKI_TZ)
-                    interval_date = start_helsinki.date()
-
-                    # Skip intervals that don't match the target date
-                    if interval_date != target:
-                        continue
-
-                    # Convert EUR/MWh to cents/kWh (with VAT already included)
-                    spot_cents_with_vat = eur_mwh_to_cents_kwh(it.price_eur_per_mwh)
-
-                    # Split electricity price into low/medium/high buckets like Angular component
-                    low_electricity = (
-                        spot_cents_with_vat if spot_cents_with_vat < LOW_PRICE else 0
-                    )
-                    medium_electricity = (
-                        spot_cents_with_vat
-                        if LOW_PRICE <= spot_cents_with_vat < HIGH_PRICE
-                        else 0
-                    )
-                    high_electricity = (
-                        spot_cents_with_vat if spot_cents_with_vat >= HIGH_PRICE else 0
-                    )
-
-                    # Create time label based on granularity
-                    if dp.granularity == "quarter_hour":
-                        # For 15-minute intervals, use sequential integer indices
-                        # This prevents Google Charts from generating intermediate ticks
-                        quarter = start_helsinki.minute // 15
-                        time_label = str(start_helsinki.hour * 4 + quarter)
-                    else:
-                        # For hourly intervals, use hour only
-                        time_label = str(start_helsinki.hour)
-
-                    chart_data.append(
-                        [
-                            time_label,
-                            low_electricity,
-                            medium_electricity,
-                            high_electricity,
-                            margin_cents,
-                        ],
-                    )
-
-            # Sort chart data by time to ensure proper order
-            # Both hourly and 15-minute data now use integer indices, so sort numerically
-            chart_data.sort(key=lambda x: int(x[0]))
-
-            # Ensure all intervals are represented for consistent chart layout
-            complete_chart_data = []
-            actual_granularity = "hour"  # Default fallback
-
-            if dp and dp.granularity == "quarter_hour":
-                # For 15-minute data, create complete 96-interval chart
-                actual_granularity = "quarter_hour"
-                chart_data_dict = {row[0]: row for row in chart_data}
-
-                for i in range(96):
-                    time_key = str(i)
-                    if time_key in chart_data_dict:
-                        # Use existing data
-                        complete_chart_data.append(chart_data_dict[time_key])
-                    else:
-                        # Fill missing interval with zeros (margin still applies)
-                        complete_chart_data.append(
-                            [time_key, 0, 0, 0, margin_cents],
-                        )
-            else:
-                # For hourly data or when no data available, create complete 24-hour chart
-                actual_granularity = "hour"
-                chart_data_dict = (
-                    {int(row[0]): row for row in chart_data} if chart_data else {}
+            if fmt == "compact":
+                response = JSONResponse(
+                    {
+                        "format": "compact",
+                        **compact_chart_day(dp, target, granularity, encoding),
+                        "margin": margin_cents,
+                        "bands": [LOW_PRICE_CENTS, HIGH_PRICE_CENTS],
+                        "maxPrice": global_max_price,
+                        "minPrice": global_min_price,
+                        "stale": stale,
+                    },
                 )
+                if cacheable_response(dp, snap):
+                    responses.put(key, generation, response.body)
+                return response
 
-                for hour in range(24):
-                    hour_str = str(hour)
-                    if hour in chart_data_dict:
-                        # Use existing data
-                        complete_chart_data.append(chart_data_dict[hour])
-                    else:
-                        # Fill missing hour with zeros (margin still applies)
-                        complete_chart_data.append([hour_str, 0, 0, 0, margin_cents])
+            complete_chart_data, actual_granularity, has_data = build_chart_rows(
+                dp,
+                target,
+                margin_cents,
+                granularity,
+            )
 
             # Handle case where no actual price data found
-            if not chart_data:
+            if not has_data:
                 logger.warning(f"No price data found for date {target}")
                 return JSONResponse(
                     {
@@ -720,11 +1070,12 @@ def create_app() -> FastAPI:
                         "dateString": target.strftime("%A %m/%d/%Y"),
                         "granularity": actual_granularity,  # Use the determined granularity
                         "intervalCount": len(complete_chart_data),
+                        "stale": stale,
                         "error": "No price data available for this date",
                     },
                 )
 
-            return JSONResponse(
+            response = JSONResponse(
                 {
                     "data": complete_chart_data,
                     "maxPrice": global_max_price,
@@ -732,8 +1083,12 @@ def create_app() -> FastAPI:
                     "dateString": target.strftime("%A %m/%d/%Y"),
                     "granularity": actual_granularity,
                     "intervalCount": len(complete_chart_data),
+                    "stale": stale,
                 },
             )
+            if cacheable_response(dp, snap):
+                responses.put(key, generation, response.body)
+            return response
         except Exception as e:
             logger.error(f"Error in chart-data endpoint: {e}")
             raise HTTPException(
@@ -741,19 +1096,75 @@ def create_app() -> FastAPI:
                 detail=f"Error fetching chart data: {e!s}",
             )
 
-    def eur_mwh_to_cents_kwh(eur_per_mwh: float) -> float:
-        # 1 MWh = 1000 kWh; EUR/MWh to EUR/kWh then to cents; include VAT
-        eur_per_kwh = eur_per_mwh / 1000.0
-        cents_per_kwh = eur_per_kwh * 100.0
-        with_vat = cents_per_kwh * (1.0 + VAT_RATE)
-        return with_vat
-
-    def color_for_spot_cents(spot_cents: float) -> str:
-        if spot_cents < 5.0:
-            return "green"
-        if spot_cents < 15.0:
-            return "yellow"
-        return "red"
+    @app.get("/api/chart-bundle", response_class=JSONResponse)
+    async def api_chart_bundle(
+        margin: float | None = Query(default=None),
+        granularity: Granularity | None = Query(default=None),
+        zone: str | None = Query(default=None),
+        encoding: ChartEncoding = Query(default="json"),
+    ) -> Response:
+        """Today's and tomorrow's charts in the compact format, in one response.
+
+        Both days, the shared price range and the current slot come from one
+        cache snapshot, with one freshness check and one range computation.
+        """
+        zone_code = resolve_zone(zone)
+        if warming_up(zone_code):
+            return pending_response()
+        margin_cents = (
+            validate_margin(margin)
+            if margin is not None
+            else DEFAULT_MARGIN_CENTS_PER_KWH
+        )
+        snap = caches[zone_code].snapshot
+        stale = check_live_cache(zone_code, snap)
+        responses = response_caches[zone_code]
+        now_local = datetime.now(tz=get_zone(zone_code).tz)
+        today_d = now_local.date()
+        # The current slot changes within a generation
+        key = ("chart-bundle", today_d, margin_cents, granularity, encoding, stale)
+        key += (current_slot(now_local, "quarter_hour"),)
+        generation = snap.generation
+        body = responses.get(key, generation)
+        if body is not None:
+            return Response(body, media_type="application/json")
+
+        min_price, max_price = calculate_global_price_range(margin_cents, snap)
+        days: dict[str, dict[str, t.Any]] = {}
+        for name, target in (
+            ("today", today_d),
+            ("tomorrow", today_d + timedelta(days=1)),
+        ):
+            dp = next(
+                (
+                    live
+                    for live in (snap.today, snap.tomorrow)
+                    if live is not None and live.count(target)
+                ),
+                None,
+            )
+            days[name] = {
+                "date": target.isoformat(),
+                **compact_chart_day(dp, target, granularity, encoding),
+                "hasData": dp is not None,
+            }
+        response = JSONResponse(
+            {
+                "format": "compact",
+                "margin": margin_cents,
+                "bands": [LOW_PRICE_CENTS, HIGH_PRICE_CENTS],
+                "maxPrice": max_price,
+                "minPrice": min_price,
+                "stale": stale,
+                "now": {
+                    "date": today_d.isoformat(),
+                    "slot": current_slot(now_local, days["today"]["granularity"]),
+                },
+                "days": days,
+            },
+        )
+        responses.put(key, generation, response.body)
+        return response
 
     def validate_margin(margin: float) -> float:
         """Validate margin parameter and ensure it's within acceptable range"""
@@ -769,60 +1180,45 @@ def create_app() -> FastAPI:
             )
         return margin
 
-    def build_view_model(dp: DayPrices, margin_cents: float) -> dict[str, t.Any]:
-        entries: list[dict[str, t.Any]] = []
-        for it in dp.intervals:
-            spot_cents = eur_mwh_to_cents_kwh(it.price_eur_per_mwh)
-            total_cents = max(0.0, spot_cents) + max(0.0, margin_cents)
-            entries.append(
-                {
-                    "startUtc": it.start_utc,
-                    "endUtc": it.end_utc,
-                    "spotCents": spot_cents,
-                    "marginCents": margin_cents,
-                    "totalCents": total_cents,
-                    "color": color_for_spot_cents(spot_cents),
-                },
-            )
-        max_total = max((e["totalCents"] for e in entries), default=1.0) or 1.0
-        return {
-            "entries": entries,
-            "maxTotal": max_total,
-            "granularity": dp.granularity,
-        }
+    def pending_partial(request: Request) -> HTMLResponse:
+        # Placeholder that asks again once prices may have arrived
+        return templates.TemplateResponse(
+            "partials/pending.html",
+            {"request": request, "retry_after": PENDING_RETRY_SECONDS},
+        )
 
     @app.get("/partials/prices", response_class=HTMLResponse)
     async def partial_prices(
         request: Request,
         date: str,
         margin: float | None = None,
+        zone: str | None = None,
     ) -> HTMLResponse:
+        zone_code = resolve_zone(zone)
         margin_cents = margin if margin is not None else DEFAULT_MARGIN_CENTS_PER_KWH
         # Validate margin parameter if provided
         if margin is not None:
             margin_cents = validate_margin(margin_cents)
-        logger.debug("/partials/prices date=%s margin=%.3f", date, margin_cents)
-        now_hel = datetime.now(tz=HELSINKI_TZ)
-        base_date = now_hel.date()
+        logger.debug(
+            "/partials/prices zone=%s date=%s margin=%.3f",
+            zone_code,
+            date,
+            margin_cents,
+        )
+        if warming_up(zone_code):
+            return pending_partial(request)
+        base_date = _local_today(zone_code)
+        snap = caches[zone_code].snapshot
+        skeleton = False
         if date == "today":
-            # Check if today's cache contains data for the current date
-            if cache.today is not None:
-                today_intervals_for_current_date = [
-                    it
-                    for it in cache.today.intervals
-                    if it.start_utc.astimezone(HELSINKI_TZ).date() == base_date
-                ]
-                if len(today_intervals_for_current_date) > 0:
-                    dp = cache.today
-                else:
-                    logger.warning(
-                        f"Today's cache contains no data for current date {base_date}, fetching fresh data",
-                    )
-                    dp = await fetch_prices_for_day(base_date)
-            else:
-                dp = await fetch_prices_for_day(base_date)
+            dp, _ = await cached_prices_for_day(zone_code, base_date, snap)
+            if dp is None:
+                logger.warning(
+                    f"No prices cached for {base_date} yet, rendering placeholder",
+                )
+                return pending_partial(request)
         elif date == "tomorrow":
-            dp = cache.tomorrow
+            dp = snap.tomorrow
             if dp is None:
                 # Build margin-only skeleton for tomorrow
                 logger.info(
@@ -838,99 +1234,118 @@ def create_app() -> FastAPI:
                 # Use 15-minute intervals if date is after Oct 1, 2025 or for testing current dates
                 if tomorrow_date >= date(2025, 10, 1) or tomorrow_date >= date.today():
                     # Create 96 fifteen-minute intervals
-                    intervals = [
-                        PriceInterval(
-                            start_utc + i * timedelta(minutes=15),
-                            start_utc + (i + 1) * timedelta(minutes=15),
-                            0.0,
-                        )
-                        for i in range(96)
-                    ]
+                    intervals = PriceSeries.from_prices(start_utc, 900, [0.0] * 96)
                     granularity = "quarter_hour"
                 else:
                     # Create 24 hourly intervals
-                    intervals = [
-                        PriceInterval(
-                            start_utc + i * timedelta(hours=1),
-                            start_utc + (i + 1) * timedelta(hours=1),
-                            0.0,
-                        )
-                        for i in range(24)
-                    ]
+                    intervals = PriceSeries.from_prices(start_utc, 3600, [0.0] * 24)
                     granularity = "hour"
 
                 dp = DayPrices(
-                    market="FI",
+                    market=zone_code,
                     granularity=granularity,
                     intervals=intervals,
                     published_at_utc=None,
                 )
+                skeleton = True
         else:
             try:
                 target = datetime.fromisoformat(date).date()
             except Exception as exc:
                 logger.warning("Invalid date param: %s", date)
                 raise HTTPException(status_code=400, detail="Invalid date") from exc
-            dp = await fetch_prices_for_day(target)
+            dp, _ = await cached_prices_for_day(zone_code, target, snap)
+            if dp is None:
+                return pending_partial(request)
+
+        # The fragment renders the raw query values, so key on those. It is
+        # kept compressed too: gzipping it costs more than rendering it
+        params = request.query_params
+        gzipped = "gzip" in request.headers.get("accept-encoding", "")
+        key = (
+            "partial",
+            base_date,
+            date,
+            params.get("margin", "0"),
+            params.get("zone", ""),
+            dp.content_digest,
+            gzipped,
+        )
+        headers = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        responses = response_caches[zone_code]
+        generation = snap.generation
+        body = responses.get(key, generation)
+        if body is not None:
+            return HTMLResponse(body, headers=headers if gzipped else None)
 
         vm = build_view_model(dp, margin_cents)
-        return templates.TemplateResponse(
+        response = templates.TemplateResponse(
             "partials/prices.html",
             {
                 "request": request,
                 "vm": vm,
             },
         )
+        if not (skeleton or cacheable_response(dp, snap)):
+            return response
+        if not gzipped:
+            responses.put(key, generation, response.body)
+            return response
+        body = gzip.compress(response.body, mtime=0)
+        responses.put(key, generation, body)
+        return HTMLResponse(body, headers=headers)
 
     async def startup_tasks():
-        # Initial fetch with retry/backoff until we have today's data
+        # Initial fetch with retry/backoff until every zone has today's data
         backoff = 10
         while True:
             try:
                 logger.info("Startup fetch attempt (backoff=%ss)", backoff)
-                await ensure_cache_now()
-                if cache.today is not None:
-                    logger.info("Startup fetch succeeded; cache is warm")
-                    break
+                await ensure_all_caches_now()
             except Exception:
                 logger.exception("Startup fetch failed; will retry")
+            warmed.update(
+                zone for zone, cache in caches.items() if cache.snapshot.today
+            )
+            if len(warmed) == len(caches):
+                logger.info("Startup fetch succeeded; cache is warm")
+                break
             await asyncio.sleep(backoff)
             backoff = min(backoff * 2, 300)
 
+        def zone_state(zone: str) -> tuple[bool, bool]:
+            """Whether `zone` has today's prices and complete tomorrow's prices."""
+            today_d = _local_today(zone)
+            snap = caches[zone].snapshot
+            has_today = snap.today is not None and snap.today.count(today_d) > 0
+            has_tomorrow = False
+            if snap.tomorrow is not None:
+                # Consider tomorrow data complete based on granularity
+                expected_intervals = _get_expected_intervals(snap.tomorrow.granularity)
+                tomorrow_count = snap.tomorrow.count(today_d + timedelta(days=1))
+                has_tomorrow = tomorrow_count >= expected_intervals
+            return has_today, has_tomorrow
+
         async def intelligent_polling_loop():
-            """Intelligent polling that adapts based on data availability and time"""
+            """Intelligent polling that adapts based on data availability and time.
+
+            All zones share one schedule: each round refreshes every zone,
+            and the most urgent zone decides when the next round runs.
+            """
             consecutive_failures = 0
             last_failure_time = None
 
             while True:
+                # Publication times follow CET for every zone, so the
+                # schedule runs on Helsinki time
                 now = datetime.now(tz=HELSINKI_TZ)
                 today_d = now.date()
                 tomorrow_d = today_d + timedelta(days=1)
 
                 # Assess current data state with date validation
-                has_today = (
-                    cache.today is not None
-                    and any(
-                        it.start_utc.astimezone(HELSINKI_TZ).date() == today_d
-                        for it in cache.today.intervals
-                    )
-                    if cache.today
-                    else False
-                )
-
-                # Check if we have complete tomorrow data (all 24 hours)
-                has_tomorrow = False
-                if cache.tomorrow is not None:
-                    tomorrow_intervals = [
-                        it
-                        for it in cache.tomorrow.intervals
-                        if it.start_utc.astimezone(HELSINKI_TZ).date() == tomorrow_d
-                    ]
-                    # Consider tomorrow data complete based on granularity
-                    expected_intervals = _get_expected_intervals(
-                        cache.tomorrow.granularity,
-                    )
-                    has_tomorrow = len(tomorrow_intervals) >= expected_intervals
+                states = [zone_state(zone) for zone in caches]
+                has_today = all(today for today, _ in states)
+                has_tomorrow = all(tomorrow for _, tomorrow in states)
 
                 # Determine urgency based on missing critical data
                 missing_today = not has_today
@@ -986,75 +1401,10 @@ def create_app() -> FastAPI:
 
                 # Attempt cache update
                 try:
-                    old_today = cache.today
-                    old_tomorrow = cache.tomorrow
-
-                    await ensure_cache_now()
-
-                    # Log any changes
-                    if old_today is None and cache.today is not None:
-                        logger.info(
-                            f"Successfully retrieved today's prices ({today_d})",
-                        )
-                    if old_tomorrow is None and cache.tomorrow is not None:
-                        logger.info(
-                            f"Successfully retrieved tomorrow's prices ({tomorrow_d})",
-                        )
-
-                    # Check for data updates (republications) for both today and tomorrow
-                    for name, old_data, new_data in [
-                        ("today", old_today, cache.today),
-                        ("tomorrow", old_tomorrow, cache.tomorrow),
-                    ]:
-                        if old_data is not None and new_data is not None:
-                            # Check if data was republished
-                            if old_data.published_at_utc != new_data.published_at_utc:
-                                logger.info(
-                                    f"{name.title()}'s price data was republished",
-                                )
-                                # Send update event to refresh charts with new scaling
-                                await notify_cache_event(
-                                    f"{name}_updated",
-                                    {
-                                        "date": (
-                                            today_d if name == "today" else tomorrow_d
-                                        ).isoformat(),
-                                        "reason": "republished",
-                                    },
-                                )
-                            # Check if interval count changed
-                            elif len(old_data.intervals) != len(new_data.intervals):
-                                logger.info(
-                                    f"{name.title()}'s price data changed (different interval count)",
-                                )
-                                await notify_cache_event(
-                                    f"{name}_updated",
-                                    {
-                                        "date": (
-                                            today_d if name == "today" else tomorrow_d
-                                        ).isoformat(),
-                                        "reason": "interval_count_changed",
-                                    },
-                                )
-                            # Check if actual price values changed
-                            elif any(
-                                old_it.price_eur_per_mwh != new_it.price_eur_per_mwh
-                                for old_it, new_it in zip(
-                                    old_data.intervals,
-                                    new_data.intervals,
-                                    strict=False,
-                                )
-                            ):
-                                logger.info(f"{name.title()}'s price values changed")
-                                await notify_cache_event(
-                                    f"{name}_updated",
-                                    {
-                                        "date": (
-                                            today_d if name == "today" else tomorrow_d
-                                        ).isoformat(),
-                                        "reason": "price_values_changed",
-                                    },
-                                )
+                    old_snaps = {zone: cache.snapshot for zone, cache in caches.items()}
+                    await ensure_all_caches_now()
+                    for zone, old in old_snaps.items():
+                        await report_changes(zone, old, caches[zone].snapshot)
 
                     # Reset failure counter on success
                     if consecutive_failures > 0:
@@ -1074,17 +1424,68 @@ def create_app() -> FastAPI:
                 # Sleep until next poll
                 await asyncio.sleep(poll_interval)
 
+        async def report_changes(
+            zone: str,
+            old: CacheSnapshot,
+            new: CacheSnapshot,
+        ) -> None:
+            today_d = _local_today(zone)
+            tomorrow_d = today_d + timedelta(days=1)
+            # Log any changes
+            if old.today is None and new.today is not None:
+                logger.info(f"Successfully retrieved {zone} today's prices ({today_d})")
+            if old.tomorrow is None and new.tomorrow is not None:
+                logger.info(
+                    f"Successfully retrieved {zone} tomorrow's prices ({tomorrow_d})",
+                )
+
+            # Check for data updates (republications) for both today and tomorrow
+            for name, old_data, new_data in [
+                ("today", old.today, new.today),
+                ("tomorrow", old.tomorrow, new.tomorrow),
+            ]:
+                if old_data is None or new_data is None or old_data is new_data:
+                    continue  # Nothing was replaced
+                # Digests cover the whole price content, so comparing
+                # them is enough when both sides have one
+                old_digest = old_data.content_digest
+                new_digest = new_data.content_digest
+                if old_digest and new_digest:
+                    changed = old_digest != new_digest
+                    reason = "republished"
+                elif len(old_data.intervals) != len(new_data.intervals):
+                    changed = True
+                    reason = "interval_count_changed"
+                else:
+                    changed = old_data.intervals.prices != new_data.intervals.prices
+                    reason = "price_values_changed"
+                if changed:
+                    logger.info(f"{zone} {name}'s price data changed ({reason})")
+                    # Send update event to refresh charts with new scaling
+                    await notify_cache_event(
+                        f"{name}_updated",
+                        {
+                            "date": (
+                                today_d if name == "today" else tomorrow_d
+                            ).isoformat(),
+                            "reason": reason,
+                            "zone": zone,
+                        },
+                    )
+
         async def midnight_cache_rotation_loop():
             """Background task to ensure cache rotation happens at midnight even if no requests come in"""
             while True:
-                now = datetime.now(tz=HELSINKI_TZ)
-                # Calculate seconds until next midnight in Helsinki timezone
+                now = datetime.now(tz=UTC)
+                # Calculate seconds until the next midnight of any served zone
                 # Get the next day and create midnight properly with timezone
-                next_day = now.date() + timedelta(days=1)
-                next_midnight = datetime.combine(
-                    next_day,
-                    datetime.min.time(),
-                    tzinfo=HELSINKI_TZ,
+                next_midnight = min(
+                    datetime.combine(
+                        _local_today(zone) + timedelta(days=1),
+                        datetime.min.time(),
+                        tzinfo=get_zone(zone).tz,
+                    )
+                    for zone in caches
                 )
                 seconds_until_midnight = (next_midnight - now).total_seconds()
 
@@ -1095,17 +1496,68 @@ def create_app() -> FastAPI:
                 logger.info(
                     f"Midnight timer: checking cache rotation at {datetime.now(tz=HELSINKI_TZ)}",
                 )
-                await ensure_cache_now()
+                await ensure_all_caches_now()
                 logger.info("Midnight cache rotation check completed")
 
                 # Sleep a bit to avoid multiple triggers
                 await asyncio.sleep(60)
 
-        asyncio.create_task(intelligent_polling_loop())
-        asyncio.create_task(midnight_cache_rotation_loop())
-
-    @app.on_event("startup")
-    async def _on_startup() -> None:
+        background_tasks.add(asyncio.create_task(intelligent_polling_loop()))
+        background_tasks.add(asyncio.create_task(midnight_cache_rotation_loop()))
+
+    async def run_worker() -> None:
+        shared: SharedState | None = app.state.shared
+        if shared is not None:
+            # Serve the elected poller's snapshots until this worker gets
+            # the lock, e.g. because the poller exited
+            while not shared.try_lead():
+                await follow_snapshot(shared)
+                await asyncio.sleep(SNAPSHOT_POLL_SECONDS)
         await startup_tasks()
 
+    # Warmup and polling tasks; kept referenced so they are not garbage
+    # collected, and cancelled on shutdown
+    background_tasks: set[asyncio.Task[None]] = set()
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> t.AsyncIterator[None]:
+        # One pooled client for the whole process: keep-alive avoids a fresh
+        # DNS/TCP/TLS handshake on every poll, cache miss and retry
+        app.state.http_client = create_http_client()
+        # Prices fetched before a restart are served from disk, so warmup
+        # only waits for ENTSO-E when the store lacks today's prices
+        app.state.price_store = None
+        if STORE_PATH:
+            try:
+                app.state.price_store = await asyncio.to_thread(
+                    PriceStore.open,
+                    STORE_PATH,
+                )
+            except (OSError, sqlite3.Error):
+                logger.exception("Price store unavailable; keeping prices in memory")
+        # Warm up in the background so the server accepts connections (and
+        # /healthz answers) right away; /readyz turns 200 once prices are in
+        app.state.shared = None
+        if SHARED_DIR:
+            try:
+                app.state.shared = SharedState(SHARED_DIR)
+            except OSError:
+                logger.exception("Shared directory unavailable; polling from here")
+        background_tasks.add(asyncio.create_task(run_worker()))
+        try:
+            yield
+        finally:
+            tasks = [*background_tasks, *revalidations.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            background_tasks.clear()
+            await app.state.http_client.aclose()
+            if app.state.price_store is not None:
+                app.state.price_store.close()
+            if app.state.shared is not None:
+                app.state.shared.close()
+
+    app.router.lifespan_context = lifespan
+
     return app
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import typing as t
+from array import array
+from datetime import UTC, datetime, timedelta, tzinfo
+
+from .series import PricePoint, PriceSeries, split_by_local_date
+
+Granularity: t.TypeAlias = t.Literal["quarter_hour", "hour", "day"]
+Aggregation: t.TypeAlias = t.Literal["mean", "min", "max"]
+
+STEP_SECONDS: dict[str, int] = {"quarter_hour": 900, "hour": 3600}
+
+
+def _mean(prices: memoryview) -> float:
+    return sum(prices) / len(prices)
+
+
+AGGREGATES: dict[str, t.Callable[[memoryview], float]] = {
+    "mean": _mean,
+    "min": min,
+    "max": max,
+}
+
+
+def aggregate(prices: memoryview, how: Aggregation = "mean") -> float:
+    return AGGREGATES[how](prices)
+
+
+def resample(
+    series: PriceSeries,
+    step_seconds: int,
+    how: Aggregation = "mean",
+) -> PriceSeries:
+    """Change the step of `series` to a multiple or divisor of its own.
+
+    Upsampling repeats each price; downsampling aggregates the prices in each
+    bucket, with buckets aligned to multiples of `step_seconds` since the
+    epoch. Partial buckets at the edges aggregate what they have.
+    """
+    step = series.step_seconds
+    if step_seconds == step:
+        return series
+    if not len(series):
+        return PriceSeries(series.start_epoch, step_seconds, series.prices)
+
+    if step_seconds < step:
+        if step % step_seconds:
+            raise ValueError(f"Cannot upsample {step}s steps to {step_seconds}s")
+        factor = step // step_seconds
+        prices = array("d", bytes(8 * factor * len(series)))
+        target = memoryview(prices)
+        for offset in range(factor):
+            target[offset::factor] = series.prices
+        return PriceSeries(series.start_epoch, step_seconds, target)
+
+    if step_seconds % step:
+        raise ValueError(f"Cannot downsample {step}s steps to {step_seconds}s")
+    factor = step_seconds // step
+    start = series.start_epoch - series.start_epoch % step_seconds
+    # Points belonging to the (possibly partial) first bucket
+    head = factor - (series.start_epoch - start) // step
+    fn = AGGREGATES[how]
+    source = series.prices
+    bounds = range(head, len(source), factor)
+    prices = array(
+        "d",
+        map(fn, [source[:head], *(source[i : i + factor] for i in bounds)]),
+    )
+    return PriceSeries(start, step_seconds, memoryview(prices))
+
+
+def resample_daily(
+    series: PriceSeries,
+    zone: tzinfo,
+    how: Aggregation = "mean",
+) -> list[PricePoint]:
+    """One point per local day in `zone`, spanning that day's midnights."""
+    fn = AGGREGATES[how]
+    points: list[PricePoint] = []
+    for day, part in split_by_local_date(series, zone).items():
+        start = datetime.combine(day, datetime.min.time(), tzinfo=zone)
+        end = datetime.combine(
+            day + timedelta(days=1),
+            datetime.min.time(),
+            tzinfo=zone,
+        )
+        points.append(
+            PricePoint(start.astimezone(UTC), end.astimezone(UTC), fn(part.prices)),
+        )
+    return points
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import os
+import typing as t
+from collections import OrderedDict
+
+# Upper bound for cached response bodies, in bytes
+RESPONSE_CACHE_BYTES = int(os.environ.get("SPOT_RESPONSE_CACHE_BYTES", "4000000"))
+
+
+class ResponseCache:
+    """Encoded response bodies for the current cache generation.
+
+    Keys describe the request (endpoint, date, margin, ...). Entries from an
+    older generation are dropped as soon as a newer one is seen, and the least
+    recently used bodies are evicted once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.generation = -1
+        self._size = 0
+        self._entries: OrderedDict[t.Hashable, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: t.Hashable, generation: int) -> bytes | None:
+        if generation != self.generation:
+            return None
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: t.Hashable, generation: int, body: bytes) -> None:
+        if generation < self.generation or len(body) > self.max_bytes:
+            return
+        if generation > self.generation:
+            self._entries.clear()
+            self._size = 0
+            self.generation = generation
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = body
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import typing as t
+from array import array
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta, tzinfo
+
+
+@dataclass(frozen=True)
+class PricePoint:
+    start_utc: datetime
+    end_utc: datetime
+    price_eur_per_mwh: float
+
+
+def _to_epoch(value: datetime | int) -> int:
+    return value if isinstance(value, int) else int(value.timestamp())
+
+
+def _from_epoch(epoch: int) -> datetime:
+    return datetime.fromtimestamp(epoch, UTC)
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """Evenly spaced prices (EUR/MWh) starting at start_epoch, one per step.
+
+    Prices live in one float64 buffer. Slices share that buffer, and
+    datetimes are only created when a point is actually accessed.
+    """
+
+    start_epoch: int
+    step_seconds: int
+    prices: memoryview
+
+    @classmethod
+    def from_prices(
+        cls,
+        start: datetime | int,
+        step_seconds: int,
+        prices: t.Iterable[float],
+    ) -> PriceSeries:
+        buffer = prices if isinstance(prices, array) else array("d", prices)
+        return cls(_to_epoch(start), step_seconds, memoryview(buffer))
+
+    @classmethod
+    def from_points(cls, points: t.Sequence[PricePoint]) -> PriceSeries:
+        """Build from contiguous, equally long points (e.g. a filtered list)."""
+        if not points:
+            return cls.from_prices(0, 3600, ())
+        step = int((points[0].end_utc - points[0].start_utc).total_seconds())
+        return cls.from_prices(
+            points[0].start_utc,
+            step,
+            (p.price_eur_per_mwh for p in points),
+        )
+
+    @property
+    def end_epoch(self) -> int:
+        return self.start_epoch + len(self.prices) * self.step_seconds
+
+    @property
+    def start_utc(self) -> datetime:
+        return _from_epoch(self.start_epoch)
+
+    @property
+    def end_utc(self) -> datetime:
+        return _from_epoch(self.end_epoch)
+
+    def start_at(self, index: int) -> datetime:
+        return _from_epoch(self.start_epoch + index * self.step_seconds)
+
+    def index_at(self, when: datetime | int) -> int | None:
+        """Index of the interval containing `when`, or None if outside."""
+        offset = _to_epoch(when) - self.start_epoch
+        if offset < 0 or offset >= len(self.prices) * self.step_seconds:
+            return None
+        return offset // self.step_seconds
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __iter__(self) -> t.Iterator[PricePoint]:
+        step = self.step_seconds
+        epoch = self.start_epoch
+        for price in self.prices:
+            yield PricePoint(_from_epoch(epoch), _from_epoch(epoch + step), price)
+            epoch += step
+
+    @t.overload
+    def __getitem__(self, index: int) -> PricePoint: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> PriceSeries: ...
+
+    def __getitem__(self, index: int | slice) -> PricePoint | PriceSeries:
+        if isinstance(index, slice):
+            start, stop, stride = index.indices(len(self.prices))
+            if stride != 1:
+                raise ValueError("PriceSeries slices must be contiguous")
+            return PriceSeries(
+                self.start_epoch + start * self.step_seconds,
+                self.step_seconds,
+                self.prices[start:stop],
+            )
+        price = self.prices[index]
+        if index < 0:
+            index += len(self.prices)
+        start_epoch = self.start_epoch + index * self.step_seconds
+        return PricePoint(
+            _from_epoch(start_epoch),
+            _from_epoch(start_epoch + self.step_seconds),
+            price,
+        )
+
+
+def concat_series(parts: t.Sequence[PriceSeries]) -> PriceSeries:
+    """Merge same-step series into one covering all of them.
+
+    Later parts win where they overlap; holes repeat the previous price.
+    """
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return PriceSeries.from_prices(0, 3600, ())
+    if len(parts) == 1:
+        return parts[0]
+    step = parts[0].step_seconds
+    if any(p.step_seconds != step for p in parts):
+        raise ValueError("Cannot concatenate series with different steps")
+
+    start = min(p.start_epoch for p in parts)
+    count = (max(p.end_epoch for p in parts) - start) // step
+    prices = array("d", bytes(8 * count))
+    target = memoryview(prices)
+    filled = bytearray(count)
+    for p in parts:
+        offset = (p.start_epoch - start) // step
+        target[offset : offset + len(p)] = p.prices
+        filled[offset : offset + len(p)] = b"\x01" * len(p)
+
+    hole = filled.find(0)
+    while hole != -1:
+        prices[hole] = prices[hole - 1] if hole else 0.0
+        hole = filled.find(0, hole + 1)
+    return PriceSeries(start, step, target)
+
+
+def index_by_local_date(
+    series: PriceSeries,
+    zone: tzinfo,
+) -> dict[date, tuple[int, int]]:
+    """Index range [start, stop) of each local day in `zone` covered by `series`."""
+    if not len(series):
+        return {}
+    index: dict[date, tuple[int, int]] = {}
+    step = series.step_seconds
+    day = series.start_utc.astimezone(zone).date()
+    while True:
+        midnight = datetime.combine(day, datetime.min.time(), tzinfo=zone)
+        if _to_epoch(midnight) >= series.end_epoch:
+            return index
+        next_day = day + timedelta(days=1)
+        next_midnight = datetime.combine(next_day, datetime.min.time(), tzinfo=zone)
+        lo = -(-(_to_epoch(midnight) - series.start_epoch) // step)
+        hi = -(-(_to_epoch(next_midnight) - series.start_epoch) // step)
+        lo, hi = max(lo, 0), min(hi, len(series))
+        if hi > lo:
+            index[day] = (lo, hi)
+        day = next_day
+
+
+def split_by_local_date(series: PriceSeries, zone: tzinfo) -> dict[date, PriceSeries]:
+    """Zero-copy per-day views of `series`, keyed by local date in `zone`."""
+    return {
+        day: series[lo:hi]
+        for day, (lo, hi) in index_by_local_date(series, zone).items()
+    }
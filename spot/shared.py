@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import time
+import typing as t
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .entsoe import DaySeries
+from .series import PriceSeries
+
+# Directory shared by the workers of one host; empty = single-process mode
+SHARED_DIR = os.environ.get("SPOT_SHARED_DIR", "")
+# How often workers that do not poll ENTSO-E look for a new snapshot
+SNAPSHOT_POLL_SECONDS = float(os.environ.get("SPOT_SHARED_POLL_SECONDS", "1"))
+logger = logging.getLogger("spot.shared")
+
+_MAGIC = b"SPOTSNP1"
+# Events kept in the snapshot for workers that read it late
+_EVENT_BACKLOG = 32
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Live prices as published by the polling worker.
+
+    Price buffers are memoryviews into the mapped snapshot file; the mapping
+    stays valid after the file is replaced, until the last view is dropped.
+    """
+
+    # Keyed by e.g. "FI/today"
+    days: dict[str, DaySeries]
+    # Last refresh per zone
+    last_refresh_utc: dict[str, datetime]
+    # (sequence, event) pairs, oldest first
+    events: list[tuple[int, dict[str, t.Any]]]
+
+
+def write_snapshot(path: Path, snapshot: Snapshot) -> None:
+    """Write `snapshot` next to `path` and atomically move it into place.
+
+    Layout: magic, 8-byte header length, JSON header padded to 8 bytes, then
+    the float64 price buffers the header points to.
+    """
+    days: dict[str, dict[str, t.Any]] = {}
+    offset = 0
+    for name, ds in snapshot.days.items():
+        published = ds.published_at_utc.isoformat() if ds.published_at_utc else None
+        days[name] = {
+            "market": ds.market,
+            "granularity": ds.granularity,
+            "start_epoch": ds.points.start_epoch,
+            "step_seconds": ds.points.step_seconds,
+            "count": len(ds.points),
+            "offset": offset,
+            "published_at_utc": published,
+            "revision": ds.revision,
+            "content_digest": ds.content_digest,
+        }
+        offset += 8 * len(ds.points)
+    header = json.dumps(
+        {
+            "days": days,
+            "last_refresh_utc": {
+                zone: refreshed.isoformat()
+                for zone, refreshed in snapshot.last_refresh_utc.items()
+            },
+            "events": snapshot.events,
+        },
+    ).encode()
+    header += b" " * (-len(header) % 8)
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for ds in snapshot.days.values():
+            f.write(ds.points.prices)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: Path) -> Snapshot:
+    with open(path, "rb") as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    if bytes(buffer[:8]) != _MAGIC:
+        raise ValueError(f"Not a price snapshot: {path}")
+    header_len = int.from_bytes(buffer[8:16], "little")
+    header = json.loads(bytes(buffer[16 : 16 + header_len]))
+    base = 16 + header_len
+
+    days: dict[str, DaySeries] = {}
+    for name, day in header["days"].items():
+        start = base + day["offset"]
+        prices = buffer[start : start + 8 * day["count"]].cast("d")
+        published = day["published_at_utc"]
+        days[name] = DaySeries(
+            market=day["market"],
+            granularity=day["granularity"],
+            points=PriceSeries(day["start_epoch"], day["step_seconds"], prices),
+            published_at_utc=datetime.fromisoformat(published) if published else None,
+            revision=day["revision"],
+            content_digest=day["content_digest"],
+        )
+    return Snapshot(
+        days=days,
+        last_refresh_utc={
+            zone: datetime.fromisoformat(refreshed)
+            for zone, refreshed in header["last_refresh_utc"].items()
+        },
+        events=[(seq, event) for seq, event in header["events"]],
+    )
+
+
+class SharedState:
+    """Coordinates the uvicorn workers of one host through `directory`.
+
+    The worker holding the poller lock fetches from ENTSO-E and publishes
+    snapshots; the others map the latest snapshot and replay its events. The
+    lock is released by the OS when its holder exits, so another worker can
+    take over.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_path = self.directory / "snapshot.bin"
+        self.leader = False
+        self._lock_file: t.BinaryIO | None = None
+        self._seen: tuple[int, int, int] | None = None
+        self._event_seq: int | None = None
+        self._events: deque[tuple[int, dict[str, t.Any]]] = deque(
+            maxlen=_EVENT_BACKLOG,
+        )
+
+    def try_lead(self) -> bool:
+        """Take the poller lock if no other worker holds it."""
+        if self.leader:
+            return True
+        # Unix only; shared mode is opt-in
+        import fcntl
+
+        lock_file = open(self.directory / "poller.lock", "wb")  # noqa: SIM115
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        self.leader = True
+        logger.info(f"Worker {os.getpid()} holds the poller lock")
+        return True
+
+    def record_event(self, event: dict[str, t.Any]) -> None:
+        # Wall clock nanoseconds keep sequences increasing across failovers
+        self._events.append((time.time_ns(), event))
+
+    def publish(
+        self,
+        days: dict[str, DaySeries],
+        last_refresh_utc: dict[str, datetime],
+    ) -> None:
+        write_snapshot(
+            self.snapshot_path,
+            Snapshot(days, last_refresh_utc, list(self._events)),
+        )
+
+    def poll(self) -> Snapshot | None:
+        """The published snapshot if it changed since the last call, else None."""
+        try:
+            st = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            return None
+        seen = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if seen == self._seen:
+            return None
+        snapshot = read_snapshot(self.snapshot_path)
+        self._seen = seen
+        return snapshot
+
+    def unseen_events(self, snapshot: Snapshot) -> list[dict[str, t.Any]]:
+        """Events of `snapshot` not returned before; none on the first call."""
+        last = self._event_seq
+        self._event_seq = max([last or 0, *(seq for seq, _ in snapshot.events)])
+        if last is None:
+            return []
+        return [event for seq, event in snapshot.events if seq > last]
+
+    def close(self) -> None:
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        self.leader = False
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+K = t.TypeVar("K", bound=t.Hashable)
+V = t.TypeVar("V")
+
+
+class SingleFlight(t.Generic[K, V]):
+    """Coalesce concurrent calls for the same key into one in-flight task.
+
+    Callers arriving while a call for their key is running await its result
+    instead of starting their own. A cancelled caller does not cancel the
+    shared call.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def in_flight(self, key: K) -> bool:
+        return key in self._inflight
+
+    async def run(self, key: K, fn: t.Callable[[], t.Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled
+            task.exception()
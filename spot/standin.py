@@ -0,0 +1,307 @@
+"""Local stand-in for the ENTSO-E day-ahead price API.
+
+Serves generated A44 publication and acknowledgement documents so the app
+can be load and latency tested offline. Run it with
+
+    uvicorn spot.standin:create_app --factory --port 8001
+
+and start the app with ENTSOE_BASE_URL=http://127.0.0.1:8001/api. Behaviour
+is configured with STANDIN_* environment variables and can be changed at
+runtime through /control.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import random
+import typing as t
+import uuid
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import UTC, date, datetime, time, timedelta
+
+from dateutil import tz
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+
+# Day-ahead market days follow CET/CEST, as in the real API
+MARKET_TZ = tz.gettz("Europe/Brussels")
+# The day-ahead market switched to 15-minute products on this market day
+QUARTER_HOUR_FROM = date(2025, 10, 1)
+MAX_QUERY_DAYS = 366
+PUBLICATION_NS = "urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3"
+ACKNOWLEDGEMENT_NS = "urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0"
+logger = logging.getLogger("spot.standin")
+
+Resolution: t.TypeAlias = t.Literal["auto", "hour", "quarter_hour"]
+
+
+@dataclass(frozen=True)
+class StandinConfig:
+    # Fixed delay per request plus uniform jitter on top of it
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    # "auto" serves hourly data before QUARTER_HOUR_FROM, 15-minute after
+    resolution: Resolution = "auto"
+    # Omit points repeating the previous price (curve type A03)
+    gap_compressed: bool = False
+    # Share of requests answered with 429 / 503
+    throttle_rate: float = 0.0
+    retry_after_seconds: int = 1
+    outage: bool = False
+    # Market day D is published at this CET time on D-1; None publishes all
+    publish_time: time | None = time(12, 45)
+    # Bump to simulate a republication with different prices
+    revision: int = 1
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls) -> StandinConfig:
+        publish_time = os.environ.get("STANDIN_PUBLISH_TIME", "12:45")
+        return cls(
+            latency_seconds=float(os.environ.get("STANDIN_LATENCY", "0")),
+            latency_jitter_seconds=float(os.environ.get("STANDIN_LATENCY_JITTER", "0")),
+            resolution=t.cast(Resolution, os.environ.get("STANDIN_RESOLUTION", "auto")),
+            gap_compressed=os.environ.get("STANDIN_GAP_COMPRESSED", "0") == "1",
+            throttle_rate=float(os.environ.get("STANDIN_THROTTLE_RATE", "0")),
+            retry_after_seconds=int(os.environ.get("STANDIN_RETRY_AFTER", "1")),
+            outage=os.environ.get("STANDIN_OUTAGE", "0") == "1",
+            publish_time=time.fromisoformat(publish_time) if publish_time else None,
+            revision=int(os.environ.get("STANDIN_REVISION", "1")),
+            seed=int(os.environ.get("STANDIN_SEED", "0")),
+        )
+
+
+@dataclass
+class StandinStats:
+    requests: int = 0
+    published: int = 0
+    acknowledged: int = 0
+    throttled: int = 0
+    failed: int = 0
+
+
+def _parse_period(value: str) -> datetime:
+    return datetime.strptime(value, "%Y%m%d%H%M").replace(tzinfo=UTC)
+
+
+def _fmt(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%MZ")
+
+
+def _market_day_bounds(day: date) -> tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min, tzinfo=MARKET_TZ)
+    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=MARKET_TZ)
+    return start.astimezone(UTC), end.astimezone(UTC)
+
+
+def _is_published(config: StandinConfig, day: date, now: datetime) -> bool:
+    if config.publish_time is None:
+        return True
+    published_at = datetime.combine(
+        day - timedelta(days=1),
+        config.publish_time,
+        tzinfo=MARKET_TZ,
+    )
+    return now >= published_at
+
+
+def _step_seconds(config: StandinConfig, day: date) -> int:
+    if config.resolution == "hour":
+        return 3600
+    if config.resolution == "quarter_hour":
+        return 900
+    return 900 if day >= QUARTER_HOUR_FROM else 3600
+
+
+def _price(config: StandinConfig, start: datetime) -> float:
+    """Deterministic price for the interval starting at `start`."""
+    hour = start.replace(minute=0)
+    rng = random.Random(f"{config.seed}:{config.revision}:{hour.isoformat()}")
+    local_hour = hour.astimezone(MARKET_TZ).hour
+    # Morning and evening peaks with noise; night hours occasionally go negative
+    shape = 40 + 35 * math.sin((local_hour - 6) * math.pi / 12) ** 2
+    price = shape + rng.gauss(0, 15)
+    if config.gap_compressed:
+        # Whole-hour prices so consecutive quarter-hours repeat
+        return round(price)
+    return round(price + (start.minute / 15) * rng.uniform(-2, 2), 2)
+
+
+def _period_xml(config: StandinConfig, day: date) -> str:
+    start, end = _market_day_bounds(day)
+    step = _step_seconds(config, day)
+    count = int((end - start).total_seconds()) // step
+    points: list[str] = []
+    previous: float | None = None
+    for position in range(1, count + 1):
+        price = _price(config, start + timedelta(seconds=(position - 1) * step))
+        if config.gap_compressed and price == previous:
+            continue
+        previous = price
+        points.append(
+            f"<Point><position>{position}</position>"
+            f"<price.amount>{price}</price.amount></Point>",
+        )
+    resolution = "PT15M" if step == 900 else "PT60M"
+    return (
+        "<Period>"
+        f"<timeInterval><start>{_fmt(start)}</start>"
+        f"<end>{_fmt(end)}</end></timeInterval>"
+        f"<resolution>{resolution}</resolution>"
+        f"{''.join(points)}"
+        "</Period>"
+    )
+
+
+def publication_document(
+    config: StandinConfig,
+    domain: str,
+    days: t.Sequence[date],
+    now: datetime,
+) -> str:
+    """A44 publication with one TimeSeries per market day."""
+    series = []
+    for i, day in enumerate(days, start=1):
+        series.append(
+            "<TimeSeries>"
+            f"<mRID>{i}</mRID>"
+            "<auction.type>A01</auction.type>"
+            "<businessType>A62</businessType>"
+            f'<in_Domain.mRID codingScheme="A01">{domain}</in_Domain.mRID>'
+            f'<out_Domain.mRID codingScheme="A01">{domain}</out_Domain.mRID>'
+            "<contract_MarketAgreement.type>A01</contract_MarketAgreement.type>"
+            "<currency_Unit.name>EUR</currency_Unit.name>"
+            "<price_Measure_Unit.name>MWH</price_Measure_Unit.name>"
+            f"<curveType>{'A03' if config.gap_compressed else 'A01'}</curveType>"
+            f"{_period_xml(config, day)}"
+            "</TimeSeries>",
+        )
+    start, _ = _market_day_bounds(days[0])
+    _, end = _market_day_bounds(days[-1])
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<Publication_MarketDocument xmlns="{PUBLICATION_NS}">'
+        f"<mRID>{uuid.uuid4().hex}</mRID>"
+        f"<revisionNumber>{config.revision}</revisionNumber>"
+        "<type>A44</type>"
+        f"<createdDateTime>{now.strftime('%Y-%m-%dT%H:%M:%SZ')}</createdDateTime>"
+        f"<period.timeInterval><start>{_fmt(start)}</start>"
+        f"<end>{_fmt(end)}</end></period.timeInterval>"
+        f"{''.join(series)}"
+        "</Publication_MarketDocument>"
+    )
+
+
+def acknowledgement_document(reason: str, now: datetime, code: str = "999") -> str:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<Acknowledgement_MarketDocument xmlns="{ACKNOWLEDGEMENT_NS}">'
+        f"<mRID>{uuid.uuid4().hex}</mRID>"
+        f"<createdDateTime>{now.strftime('%Y-%m-%dT%H:%M:%SZ')}</createdDateTime>"
+        f"<Reason><code>{code}</code><text>{reason}</text></Reason>"
+        "</Acknowledgement_MarketDocument>"
+    )
+
+
+def create_app(
+    config: StandinConfig | None = None,
+    clock: t.Callable[[], datetime] = lambda: datetime.now(UTC),
+) -> FastAPI:
+    app = FastAPI(title="ENTSO-E stand-in")
+    app.state.config = config or StandinConfig.from_env()
+    app.state.stats = StandinStats()
+
+    def xml_response(body: str, status_code: int = 200) -> Response:
+        return Response(body, status_code=status_code, media_type="text/xml")
+
+    @app.get("/api")
+    async def api(
+        document_type: str = Query(alias="documentType"),
+        in_domain: str = Query(alias="in_Domain"),
+        period_start: str = Query(alias="periodStart"),
+        period_end: str = Query(alias="periodEnd"),
+        security_token: str | None = Query(default=None, alias="securityToken"),
+    ) -> Response:
+        cfg: StandinConfig = app.state.config
+        stats: StandinStats = app.state.stats
+        stats.requests += 1
+
+        delay = cfg.latency_seconds + random.uniform(0, cfg.latency_jitter_seconds)
+        if delay:
+            await asyncio.sleep(delay)
+        if not security_token:
+            stats.failed += 1
+            return Response("Unauthorized", status_code=401)
+        if cfg.outage:
+            stats.failed += 1
+            return Response("Service Unavailable", status_code=503)
+        if cfg.throttle_rate and random.random() < cfg.throttle_rate:
+            stats.throttled += 1
+            return Response(
+                "Too Many Requests",
+                status_code=429,
+                headers={"Retry-After": str(cfg.retry_after_seconds)},
+            )
+
+        now = clock()
+        try:
+            start = _parse_period(period_start)
+            end = _parse_period(period_end)
+        except ValueError:
+            stats.acknowledged += 1
+            reason = "Unable to parse periodStart/periodEnd"
+            return xml_response(acknowledgement_document(reason, now), 400)
+        if document_type != "A44" or end <= start:
+            stats.acknowledged += 1
+            reason = "No matching data found for the requested document type/period"
+            return xml_response(acknowledgement_document(reason, now))
+        if end - start > timedelta(days=MAX_QUERY_DAYS):
+            stats.acknowledged += 1
+            reason = "The amount of requested data exceeds allowed limit (1 year)"
+            return xml_response(acknowledgement_document(reason, now), 400)
+
+        # Like the real API, return every market day overlapping the window
+        days: list[date] = []
+        day = start.astimezone(MARKET_TZ).date()
+        while _market_day_bounds(day)[0] < end:
+            if _is_published(cfg, day, now):
+                days.append(day)
+            day += timedelta(days=1)
+        if not days:
+            stats.acknowledged += 1
+            reason = "No matching data found for Data item Day-ahead Prices"
+            return xml_response(acknowledgement_document(reason, now))
+
+        stats.published += 1
+        return xml_response(publication_document(cfg, in_domain, days, now))
+
+    @app.get("/control")
+    async def get_control() -> JSONResponse:
+        cfg = asdict(app.state.config)
+        if cfg["publish_time"] is not None:
+            cfg["publish_time"] = cfg["publish_time"].isoformat()
+        return JSONResponse({"config": cfg, "stats": asdict(app.state.stats)})
+
+    @app.post("/control")
+    async def set_control(request: Request) -> JSONResponse:
+        """Update config fields at runtime, e.g. {"outage": true}."""
+        changes = await request.json()
+        known = {f.name for f in fields(StandinConfig)}
+        unknown = set(changes) - known
+        if unknown:
+            raise HTTPException(400, f"Unknown settings: {sorted(unknown)}")
+        if changes.get("publish_time"):
+            changes["publish_time"] = time.fromisoformat(changes["publish_time"])
+        app.state.config = replace(app.state.config, **changes)
+        logger.info(f"Stand-in config updated: {changes}")
+        return await get_control()
+
+    @app.post("/control/reset-stats")
+    async def reset_stats() -> JSONResponse:
+        app.state.stats = StandinStats()
+        return await get_control()
+
+    return app
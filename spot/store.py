@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+from .entsoe import DaySeries, Granularity
+from .series import PriceSeries
+
+# SQLite file for fetched prices; set empty to keep prices in memory only
+STORE_PATH = os.environ.get("SPOT_STORE_PATH", "data/spot-prices.sqlite3")
+logger = logging.getLogger("spot.store")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS day_prices (
+    zone TEXT NOT NULL,
+    day TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    start_epoch INTEGER NOT NULL,
+    step_seconds INTEGER NOT NULL,
+    prices BLOB NOT NULL,
+    published_at_utc TEXT,
+    revision INTEGER,
+    content_digest TEXT,
+    stored_at_utc TEXT NOT NULL,
+    PRIMARY KEY (zone, day, resolution)
+)
+"""
+
+# Finest resolution first
+_RESOLUTION_ORDER = "CASE resolution WHEN 'quarter_hour' THEN 0 ELSE 1 END"
+
+
+class PriceStore:
+    """Fetched day-ahead prices in SQLite, keyed by (zone, date, resolution).
+
+    Methods block on disk I/O; call them through asyncio.to_thread from the
+    event loop. One connection is shared behind a lock.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._db = connection
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str | Path) -> PriceStore:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(_SCHEMA)
+        connection.commit()
+        logger.info(f"Price store opened at {path}")
+        return cls(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def save(self, zone: str, day: date, ds: DaySeries) -> None:
+        published = ds.published_at_utc.isoformat() if ds.published_at_utc else None
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO day_prices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    zone,
+                    day.isoformat(),
+                    ds.granularity,
+                    ds.points.start_epoch,
+                    ds.points.step_seconds,
+                    ds.points.prices.tobytes(),
+                    published,
+                    ds.revision,
+                    ds.content_digest,
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+
+    def stored_days(self, zone: str, start: date, end: date) -> set[date]:
+        """Days in [start, end] stored at any resolution."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT day FROM day_prices WHERE zone = ? AND day BETWEEN ? AND ?",
+                (zone, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(day) for (day,) in rows}
+
+    def load(
+        self,
+        zone: str,
+        day: date,
+        resolution: Granularity | None = None,
+    ) -> DaySeries | None:
+        """Stored series for `day`, at the finest resolution unless one is given."""
+        query = (
+            "SELECT resolution, start_epoch, step_seconds, prices, published_at_utc,"
+            " revision, content_digest FROM day_prices WHERE zone = ? AND day = ?"
+        )
+        params: tuple[str, ...] = (zone, day.isoformat())
+        if resolution is not None:
+            query += " AND resolution = ?"
+            params += (resolution,)
+        with self._lock:
+            row = self._db.execute(
+                f"{query} ORDER BY {_RESOLUTION_ORDER} LIMIT 1",
+                params,
+            ).fetchone()
+        if row is None:
+            return None
+        granularity, start_epoch, step, blob, published, revision, digest = row
+        prices = array("d")
+        prices.frombytes(blob)
+        return DaySeries(
+            market=zone,
+            granularity=granularity,
+            points=PriceSeries(start_epoch, step, memoryview(prices)),
+            published_at_utc=datetime.fromisoformat(published) if published else None,
+            revision=revision,
+            content_digest=digest,
+        )
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import base64
+import math
+import sys
+import typing as t
+from array import array
+from datetime import date, datetime
+
+from .resample import STEP_SECONDS, Granularity, aggregate, resample
+from .zones import get_zone
+
+if t.TYPE_CHECKING:
+    from .main import DayPrices
+
+VAT_RATE = 0.255
+LOW_PRICE_CENTS = 5.0
+HIGH_PRICE_CENTS = 15.0
+SECONDS_PER_DAY = 24 * 3600
+
+ChartRow: t.TypeAlias = list[t.Any]
+# "rows" for Google Charts rows, "compact" for columns the client expands
+ChartFormat: t.TypeAlias = t.Literal["rows", "compact"]
+# How compact spot prices are encoded: JSON numbers or base64 float32
+ChartEncoding: t.TypeAlias = t.Literal["json", "f32"]
+
+
+def eur_mwh_to_cents_kwh(eur_per_mwh: float) -> float:
+    # 1 MWh = 1000 kWh; EUR/MWh to EUR/kWh then to cents; include VAT
+    eur_per_kwh = eur_per_mwh / 1000.0
+    cents_per_kwh = eur_per_kwh * 100.0
+    with_vat = cents_per_kwh * (1.0 + VAT_RATE)
+    return with_vat
+
+
+def color_for_spot_cents(spot_cents: float) -> str:
+    if spot_cents < LOW_PRICE_CENTS:
+        return "green"
+    if spot_cents < HIGH_PRICE_CENTS:
+        return "yellow"
+    return "red"
+
+
+def build_view_model(dp: DayPrices, margin_cents: float) -> dict[str, t.Any]:
+    entries: list[dict[str, t.Any]] = []
+    for it in dp.intervals:
+        spot_cents = eur_mwh_to_cents_kwh(it.price_eur_per_mwh)
+        total_cents = max(0.0, spot_cents) + max(0.0, margin_cents)
+        entries.append(
+            {
+                "startUtc": it.start_utc,
+                "endUtc": it.end_utc,
+                "spotCents": spot_cents,
+                "marginCents": margin_cents,
+                "totalCents": total_cents,
+                "color": color_for_spot_cents(spot_cents),
+            },
+        )
+    max_total = max((e["totalCents"] for e in entries), default=1.0) or 1.0
+    return {
+        "entries": entries,
+        "maxTotal": max_total,
+        "granularity": dp.granularity,
+    }
+
+
+def price_range(
+    extrema: t.Iterable[tuple[float, float] | None],
+    margin_cents: float,
+) -> tuple[float, float, int, int]:
+    """Spot minimum and total maximum, plus rounded axis bounds.
+
+    `extrema` are (lowest, highest) EUR/MWh prices per day, None for days
+    without prices. The conversion to c/kWh is monotonic and the margin a
+    constant, so the range follows from them without touching the prices.
+    Returns (min, max, min_rounded, max_rounded); with no prices the range
+    defaults to 0..25 c/kWh.
+    """
+    global_max = float("-inf")
+    global_min = float("inf")
+    for day in extrema:
+        if day is None:
+            continue
+        lowest, highest = day
+        global_max = max(global_max, eur_mwh_to_cents_kwh(highest) + margin_cents)
+        # Spot price can be negative, margin is always added on top
+        global_min = min(global_min, eur_mwh_to_cents_kwh(lowest))
+
+    if global_min == float("inf") or global_max == float("-inf"):
+        global_min = 0.0
+        global_max = 25.0
+
+    # Maximum: always at least 15 cents, or round UP to next 5 cents above highest price
+    if global_max <= 0:
+        max_price_rounded = 15
+    else:
+        if global_max % 5 == 0:
+            calculated_max = int(global_max) + 5
+        else:
+            calculated_max = ((int(global_max) // 5) + 1) * 5
+        max_price_rounded = max(15, calculated_max)
+
+    # Minimum: round DOWN to next 1 cent below lowest price, or 0 for positive prices
+    if global_min >= 0:
+        min_price_rounded = 0
+    elif global_min % 1 == 0:
+        min_price_rounded = int(global_min) - 1
+    else:
+        min_price_rounded = math.floor(global_min)
+
+    return global_min, global_max, min_price_rounded, max_price_rounded
+
+
+def _slot_prices(
+    dp: DayPrices | None,
+    target: date,
+    granularity: Granularity | None,
+) -> tuple[dict[int, float], int, Granularity]:
+    """Spot prices (c/kWh, VAT included) by chart slot for one local day.
+
+    Also returns the number of slots in the day and the granularity used.
+    """
+    if granularity is None:
+        granularity = dp.granularity if dp is not None else "hour"
+    prices: dict[int, float] = {}
+    day = dp.day(target) if dp is not None else None
+
+    if granularity == "day":
+        slots = 1
+        if day:
+            prices[0] = eur_mwh_to_cents_kwh(aggregate(day.prices))
+    else:
+        step = STEP_SECONDS[granularity]
+        slots = SECONDS_PER_DAY // step
+        if day:
+            day = resample(day, step)
+            zone_tz = get_zone(dp.market).tz
+            for i, price in enumerate(day.prices):
+                start_local = day.start_at(i).astimezone(zone_tz)
+                # Sequential integer slots keep Google Charts from adding ticks;
+                # the repeated hour of a DST day lands on the same slot
+                seconds = start_local.hour * 3600 + start_local.minute * 60
+                prices[seconds // step] = eur_mwh_to_cents_kwh(price)
+    return prices, slots, granularity
+
+
+def build_chart_rows(
+    dp: DayPrices | None,
+    target: date,
+    margin_cents: float,
+    granularity: Granularity | None = None,
+) -> tuple[list[ChartRow], Granularity, bool]:
+    """Google Charts rows [label, low, medium, high, margin] for one local day.
+
+    Prices are resampled to `granularity` (hourly means of 15-minute data,
+    say) when given. Every slot of the day is present; slots without a price
+    are zero apart from the margin. Also returns the granularity used and
+    whether any price fell on `target`.
+    """
+    prices, slots, granularity = _slot_prices(dp, target, granularity)
+    rows: list[ChartRow] = []
+    for slot in range(slots):
+        spot = prices.get(slot)
+        if spot is None:
+            rows.append([str(slot), 0, 0, 0, margin_cents])
+            continue
+        # Split electricity price into low/medium/high buckets
+        rows.append(
+            [
+                str(slot),
+                spot if spot < LOW_PRICE_CENTS else 0,
+                spot if LOW_PRICE_CENTS <= spot < HIGH_PRICE_CENTS else 0,
+                spot if spot >= HIGH_PRICE_CENTS else 0,
+                margin_cents,
+            ],
+        )
+    return rows, granularity, bool(prices)
+
+
+def build_chart_columns(
+    dp: DayPrices | None,
+    target: date,
+    granularity: Granularity | None = None,
+) -> tuple[int, int, list[float | None], Granularity]:
+    """Compact form of build_chart_rows: spot prices only, one per slot.
+
+    Returns the slot count, the first priced slot, the prices from that slot
+    to the last priced one (None where a slot has no price) and the
+    granularity used. Clients split prices into bands and add the margin.
+    """
+    prices, slots, granularity = _slot_prices(dp, target, granularity)
+    if not prices:
+        return slots, 0, [], granularity
+    first = min(prices)
+    return (
+        slots,
+        first,
+        [prices.get(slot) for slot in range(first, max(prices) + 1)],
+        granularity,
+    )
+
+
+def compact_chart_day(
+    dp: DayPrices | None,
+    target: date,
+    granularity: Granularity | None,
+    encoding: ChartEncoding,
+) -> dict[str, t.Any]:
+    """The per-day fields of a format=compact chart payload."""
+    slots, first, spot, granularity = build_chart_columns(dp, target, granularity)
+    return {
+        "start": first,
+        **({"spotF32": encode_float32(spot)} if encoding == "f32" else {"spot": spot}),
+        "dateString": target.strftime("%A %m/%d/%Y"),
+        "granularity": granularity,
+        "intervalCount": slots,
+    }
+
+
+def current_slot(now_local: datetime, granularity: Granularity) -> int:
+    """Chart slot of `now_local`, a time in the zone's time zone."""
+    if granularity == "day":
+        return 0
+    seconds = now_local.hour * 3600 + now_local.minute * 60
+    return seconds // STEP_SECONDS[granularity]
+
+
+def encode_float32(values: t.Iterable[float | None]) -> str:
+    """Base64 of little-endian float32 values, NaN for missing ones."""
+    buffer = array("f", (math.nan if v is None else v for v in values))
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return base64.b64encode(buffer.tobytes()).decode("ascii")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import tzinfo
+
+from dateutil import tz
+
+
+@dataclass(frozen=True)
+class Zone:
+    """A bidding zone: its ENTSO-E EIC code and the time zone of its days."""
+
+    code: str
+    eic: str
+    tz: tzinfo
+
+
+def _zone(code: str, eic: str, tz_name: str) -> Zone:
+    return Zone(code, eic, tz.gettz(tz_name))
+
+
+ZONES: dict[str, Zone] = {
+    zone.code: zone
+    for zone in (
+        _zone("FI", "10YFI-1--------U", "Europe/Helsinki"),
+        _zone("EE", "10Y1001A1001A39I", "Europe/Tallinn"),
+        _zone("LV", "10YLV-1001A00074", "Europe/Riga"),
+        _zone("LT", "10YLT-1001A0008Q", "Europe/Vilnius"),
+        _zone("SE1", "10Y1001A1001A44P", "Europe/Stockholm"),
+        _zone("SE2", "10Y1001A1001A45N", "Europe/Stockholm"),
+        _zone("SE3", "10Y1001A1001A46L", "Europe/Stockholm"),
+        _zone("SE4", "10Y1001A1001A47J", "Europe/Stockholm"),
+        _zone("NO1", "10YNO-1--------2", "Europe/Oslo"),
+        _zone("NO2", "10YNO-2--------T", "Europe/Oslo"),
+        _zone("NO3", "10YNO-3--------J", "Europe/Oslo"),
+        _zone("NO4", "10YNO-4--------9", "Europe/Oslo"),
+        _zone("NO5", "10Y1001A1001A48H", "Europe/Oslo"),
+        _zone("DK1", "10YDK-1--------W", "Europe/Copenhagen"),
+        _zone("DK2", "10YDK-2--------M", "Europe/Copenhagen"),
+    )
+}
+DEFAULT_ZONE = "FI"
+# Zones this instance polls and serves, e.g. "FI,EE,SE3"
+ENABLED_ZONES = tuple(
+    code.strip().upper()
+    for code in os.environ.get("SPOT_ZONES", DEFAULT_ZONE).split(",")
+    if code.strip()
+)
+
+
+def get_zone(code: str) -> Zone:
+    try:
+        return ZONES[code.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown bidding zone: {code}") from None
@@ -61,6 +61,11 @@
                 }
 
                 // Handle cache updates (midnight rotation, new data arrivals)
+                // for the zone shown on this page
+                const zone = d.body.getAttribute('data-zone');
+                if (event.zone && zone && event.zone !== zone) {
+                    return;
+                }
                 if (
                     event.type === 'cache_rotated' ||
                     event.type === 'today_updated' ||
@@ -599,6 +604,22 @@
         }, 150); // 150ms debounce to handle rapid multiple events
     };
 
+    // Today's and tomorrow's charts load together; they share one
+    // /api/chart-bundle request while it is in flight
+    const chartBundles = new Map();
+    window.fetchChartBundle = function (margin, zone) {
+        const url = `/api/chart-bundle?margin=${margin}&zone=${zone}&encoding=f32`;
+        let bundle = chartBundles.get(url);
+        if (!bundle) {
+            bundle = fetch(url).then(response => response.json());
+            chartBundles.set(url, bundle);
+            // Keep it for both charts, then let later draws fetch anew
+            const forget = () => setTimeout(() => chartBundles.delete(url), 2000);
+            bundle.then(forget, forget);
+        }
+        return bundle;
+    };
+
     // Selective chart refresh function - only refreshes charts that need new data
     window.refreshChartsSelective = function (refreshToday = true, refreshTomorrow = true) {
         // Prevent multiple simultaneous refreshes
@@ -613,6 +634,8 @@
         }
 
         isRefreshInProgress = true;
+        // Refreshed charts must not reuse a bundle fetched before the update
+        chartBundles.clear();
         const chartsToRefresh = [];
         if (refreshToday) chartsToRefresh.push('today');
         if (refreshTomorrow) chartsToRefresh.push('tomorrow');
@@ -682,16 +705,17 @@
 
         // Trigger HTMX refresh for selected charts
         const margin = d.body.getAttribute('data-default-margin') || '0';
+        const zone = d.body.getAttribute('data-zone') || '';
 
         try {
             if (refreshToday) {
-                htmx.ajax('GET', `/partials/prices?date=today&margin=${margin}`, {
+                htmx.ajax('GET', `/partials/prices?date=today&margin=${margin}&zone=${zone}`, {
                     target: '#todayChart',
                     swap: 'outerHTML',
                 });
             }
             if (refreshTomorrow) {
-                htmx.ajax('GET', `/partials/prices?date=tomorrow&margin=${margin}`, {
+                htmx.ajax('GET', `/partials/prices?date=tomorrow&margin=${margin}&zone=${zone}`, {
                     target: '#tomorrowChart',
                     swap: 'outerHTML',
                 });
@@ -750,4 +774,31 @@
         // Use selective refresh with both charts enabled for backwards compatibility
         window.refreshChartsSelective(true, true);
     };
+
+    // Rebuild Google Charts rows [label, low, medium, high, margin] from a
+    // /api/chart-data?format=compact response
+    window.expandChartColumns = function (data) {
+        let spot = data.spot;
+        if (data.spotF32) {
+            const bytes = Uint8Array.from(atob(data.spotF32), c => c.charCodeAt(0));
+            spot = Array.from(new Float32Array(bytes.buffer));
+        }
+        const [low, high] = data.bands;
+        const rows = [];
+        for (let slot = 0; slot < data.intervalCount; slot++) {
+            const price = spot[slot - data.start];
+            if (price === undefined || price === null || Number.isNaN(price)) {
+                rows.push([String(slot), 0, 0, 0, data.margin]);
+            } else {
+                rows.push([
+                    String(slot),
+                    price < low ? price : 0,
+                    price >= low && price < high ? price : 0,
+                    price >= high ? price : 0,
+                    data.margin,
+                ]);
+            }
+        }
+        return rows;
+    };
 })();
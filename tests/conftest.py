@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from spot import entsoe, main, standin
+from spot.entsoe import CircuitBreaker, TokenBucket
+from spot.standin import StandinConfig
+
+
+@pytest.fixture
+def upstream_config() -> StandinConfig:
+    return StandinConfig(publish_time=None)
+
+
+@pytest.fixture
+def upstream(monkeypatch, tmp_path, upstream_config) -> FastAPI:
+    """Stand-in ENTSO-E behind the HTTP client, with a fresh FI cache and store."""
+    app = standin.create_app(upstream_config)
+    monkeypatch.setattr(
+        entsoe,
+        "create_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+    monkeypatch.setattr(entsoe, "ENTSOE_BASE_URL", "http://standin/api")
+    monkeypatch.setattr(entsoe, "_rate_limiter", TokenBucket(1000.0, 1000.0))
+    monkeypatch.setattr(entsoe, "_circuit_breaker", CircuitBreaker(5, 60.0))
+    monkeypatch.setattr(main, "ENTSOE_API_TOKEN", "token")
+    monkeypatch.setattr(main, "STORE_PATH", str(tmp_path / "prices.sqlite3"))
+    monkeypatch.setattr(main, "caches", {"FI": main.Cache()})
+    return app
+
+
+@pytest.fixture
+def app_client(upstream):
+    """Run the app's lifespan and yield a client; by default once /readyz is 200."""
+
+    @asynccontextmanager
+    async def connect(*, warm: bool = True) -> t.AsyncIterator[httpx.AsyncClient]:
+        app = main.create_app()
+        transport = httpx.ASGITransport(app=app)
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(transport=transport, base_url="http://spot") as client,
+        ):
+            if warm:
+                for _ in range(100):
+                    if (await client.get("/readyz")).status_code == 200:
+                        break
+                    await asyncio.sleep(0.05)
+                else:
+                    pytest.fail("App did not become ready")
+            yield client
+
+    return connect
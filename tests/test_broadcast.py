@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+
+from spot import main
+from spot.broadcast import CLOSED, BroadcastHub, encode_event
+
+
+def test_events_are_encoded_once_and_reach_every_client():
+    hub = BroadcastHub(max_clients=2, queue_size=4)
+    first, second = hub.subscribe(), hub.subscribe()
+    assert first is not None and second is not None
+    assert hub.full()
+    assert hub.subscribe() is None
+
+    hub.publish({"type": "today_updated"})
+
+    message = first.get_nowait()
+    assert message == encode_event({"type": "today_updated"})
+    assert second.get_nowait() is message
+
+    hub.unsubscribe(first)
+    assert not hub.full()
+
+
+def test_slow_client_is_dropped_without_affecting_others():
+    hub = BroadcastHub(queue_size=2)
+    slow, fast = hub.subscribe(), hub.subscribe()
+    assert slow is not None and fast is not None
+
+    for i in range(3):
+        hub.publish({"type": "tomorrow_updated", "n": i})
+        fast.get_nowait()
+
+    assert len(hub) == 1
+    assert slow.get_nowait() == CLOSED
+    assert slow.empty()
+
+
+class FilledUpHub(BroadcastHub):
+    """Looks free, but fills up before the subscription goes through."""
+
+    def subscribe(self) -> None:
+        return None
+
+
+def test_event_stream_is_refused_when_the_hub_is_full(app_client, monkeypatch):
+    monkeypatch.setattr(main, "BroadcastHub", FilledUpHub)
+
+    async def run() -> None:
+        async with app_client(warm=False) as client:
+            events = await client.get("/events/version")
+            assert events.status_code == 503
+            assert events.headers["Retry-After"] == "60"
+
+    asyncio.run(run())
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from spot.main import Cache, DayPrices
+from spot.series import PriceSeries
+
+START = datetime(2025, 10, 19, 21, 0, tzinfo=UTC)
+
+
+def make_day(price: float) -> DayPrices:
+    return DayPrices(
+        market="FI",
+        granularity="quarter_hour",
+        intervals=PriceSeries.from_prices(START, 900, [price] * 96),
+        published_at_utc=None,
+    )
+
+
+def test_swaps_replace_the_snapshot_and_bump_generation_on_day_changes():
+    cache = Cache()
+    empty = cache.snapshot
+    today, tomorrow = make_day(1.0), make_day(2.0)
+
+    rotated = cache.swap(today=today, tomorrow=tomorrow)
+    assert cache.snapshot is rotated
+    assert rotated.generation == empty.generation + 1
+    assert (empty.today, empty.tomorrow) == (None, None)
+
+    refreshed = cache.swap(today=today, last_refresh_utc=START)
+    assert refreshed.generation == rotated.generation
+    assert refreshed.tomorrow is tomorrow
+
+    assert cache.swap(tomorrow=None).generation == rotated.generation + 1
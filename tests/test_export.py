@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+from datetime import date
+
+from spot import entsoe, main
+from spot.entsoe import DaySeries
+from spot.store import PriceStore
+
+
+def test_export_streams_stored_days_without_refetching(upstream, app_client):
+    async def run() -> None:
+        async with app_client() as client:
+            url = "/api/export?start=2025-10-10&end=2025-10-12"
+            csv = await client.get(url)
+            assert csv.status_code == 200
+            assert csv.headers["content-type"].startswith("text/csv")
+            lines = csv.text.splitlines()
+            assert lines[0] == "startTimeUtc,endTimeUtc,priceAmount,priceCurrency,unit"
+            assert len(lines) == 1 + 3 * 96
+            assert lines[1].startswith("2025-10-09T21:00:00+00:00,")
+
+            requests = upstream.state.stats.requests
+            ndjson = await client.get(f"{url}&format=ndjson")
+            assert upstream.state.stats.requests == requests
+            rows = [json.loads(line) for line in ndjson.text.splitlines()]
+            assert len(rows) == 3 * 96
+            assert rows[0]["startTimeUtc"] == "2025-10-09T21:00:00+00:00"
+            assert rows[-1]["endTimeUtc"] == "2025-10-12T21:00:00+00:00"
+
+            bad = await client.get("/api/export?start=2025-10-12&end=2025-10-10")
+            assert bad.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_export_of_a_day_stored_by_a_single_day_fetch(upstream, app_client):
+    async def run() -> None:
+        async with app_client() as client:
+            prices = await client.get("/api/prices?date_str=2025-11-05")
+            assert prices.status_code == 200
+
+        store = PriceStore.open(main.STORE_PATH)
+        stored = store.load("FI", date(2025, 11, 5))
+        store.close()
+        assert stored is not None and len(stored.points) == 96
+
+        # After a restart the day is only in the store
+        async with app_client() as client:
+            requests = upstream.state.stats.requests
+            csv = await client.get("/api/export?start=2025-11-05&end=2025-11-05")
+            assert upstream.state.stats.requests == requests
+            lines = csv.text.splitlines()
+            assert len(lines) == 1 + 96
+            assert lines[1].startswith("2025-11-04T22:00:00+00:00,")
+            assert lines[-1].split(",")[1] == "2025-11-05T22:00:00+00:00"
+
+    asyncio.run(run())
+
+
+def test_export_fetches_only_the_runs_of_missing_days(
+    upstream,
+    app_client,
+    monkeypatch,
+):
+    calls = []
+    fetch_range = entsoe.fetch_day_ahead_price_range
+
+    async def recording_fetch_range(
+        token: str,
+        start: date,
+        end: date,
+        **kwargs: t.Any,
+    ) -> dict[date, DaySeries]:
+        calls.append((start, end))
+        return await fetch_range(token, start, end, **kwargs)
+
+    monkeypatch.setattr(entsoe, "fetch_day_ahead_price_range", recording_fetch_range)
+
+    async def run() -> None:
+        async with app_client() as client:
+            await client.get("/api/prices?date_str=2025-11-05")
+            csv = await client.get("/api/export?start=2025-11-04&end=2025-11-06")
+            assert len(csv.text.splitlines()) == 1 + 3 * 96
+
+        assert calls == [
+            (date(2025, 11, 4), date(2025, 11, 5)),
+            (date(2025, 11, 6), date(2025, 11, 7)),
+        ]
+
+    asyncio.run(run())
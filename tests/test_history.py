@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from datetime import date
+
+from spot.history import DayCache
+
+
+def test_least_recently_used_day_is_evicted():
+    cache: DayCache[str] = DayCache(capacity=2)
+    cache.put(date(2025, 10, 1), "a")
+    cache.put(date(2025, 10, 2), "b")
+    cache.get(date(2025, 10, 1))
+
+    cache.put(date(2025, 10, 3), "c")
+
+    assert len(cache) == 2
+    assert cache.peek(date(2025, 10, 2)) is None
+    assert cache.get(date(2025, 10, 1)) == "a"
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from datetime import UTC, timedelta
+import asyncio
+from datetime import UTC, date, datetime, timedelta
 
+import httpx
+import pytest
+
+from spot import entsoe
 from spot.entsoe import (
+    DataNotAvailable,
     DaySeries,
     PricePoint,
+    PriceSeries,
+    PublicationParser,
     _simulate_15min_from_hourly,
+    fetch_day_ahead_price_range,
+    parse_publication_days,
     parse_publication_xml,
+    publication_digest,
 )
 
 EXAMPLE_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -115,7 +126,7 @@ def test_simulate_15min_from_hourly():
     hourly_data = DaySeries(
         market="FI",
         granularity="hour",
-        points=hourly_points,
+        points=PriceSeries.from_points(hourly_points),
         published_at_utc=None,
     )
 
@@ -142,3 +153,195 @@ def test_simulate_15min_from_hourly():
         expected_end = expected_start + timedelta(minutes=15)
         assert simulated.points[i].start_utc == expected_start
         assert simulated.points[i].end_utc == expected_end
+
+
+TWO_DAY_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+  <TimeSeries>
+    <Period>
+      <timeInterval>
+        <start>2025-09-12T21:00Z</start>
+        <end>2025-09-13T21:00Z</end>
+      </timeInterval>
+      <resolution>PT60M</resolution>
+      <Point>
+        <position>1</position>
+        <price.amount>10.0</price.amount>
+      </Point>
+    </Period>
+  </TimeSeries>
+  <TimeSeries>
+    <Period>
+      <timeInterval>
+        <start>2025-09-13T21:00Z</start>
+        <end>2025-09-14T21:00Z</end>
+      </timeInterval>
+      <resolution>PT60M</resolution>
+      <Point>
+        <position>1</position>
+        <price.amount>20.0</price.amount>
+      </Point>
+      <Point>
+        <position>24</position>
+        <price.amount>30.0</price.amount>
+      </Point>
+    </Period>
+  </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+
+def test_parse_publication_days_splits_by_helsinki_date():
+    days = parse_publication_days(TWO_DAY_XML)
+
+    assert list(days) == [date(2025, 9, 13), date(2025, 9, 14)]
+    first, second = days[date(2025, 9, 13)], days[date(2025, 9, 14)]
+    assert len(first.points) == 24
+    assert {p.price_eur_per_mwh for p in first.points} == {10.0}
+    assert len(second.points) == 24
+    assert second.points[0].price_eur_per_mwh == 20.0
+    assert second.points[-1].price_eur_per_mwh == 30.0
+
+
+def test_parse_publication_days_uses_the_zone_time_zone():
+    # Stockholm days start an hour later than Helsinki days
+    days = parse_publication_days(TWO_DAY_XML, zone="SE3")
+
+    assert list(days) == [date(2025, 9, 12), date(2025, 9, 13), date(2025, 9, 14)]
+    day = days[date(2025, 9, 13)]
+    assert day.market == "SE3"
+    assert len(day.points) == 24
+    assert day.points[-1].price_eur_per_mwh == 20.0
+
+
+SWITCHOVER_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+  <TimeSeries>
+    <Period>
+      <timeInterval>
+        <start>2025-09-29T22:00Z</start>
+        <end>2025-09-30T22:00Z</end>
+      </timeInterval>
+      <resolution>PT60M</resolution>
+      <Point>
+        <position>1</position>
+        <price.amount>10.0</price.amount>
+      </Point>
+    </Period>
+  </TimeSeries>
+  <TimeSeries>
+    <Period>
+      <timeInterval>
+        <start>2025-09-30T22:00Z</start>
+        <end>2025-10-01T22:00Z</end>
+      </timeInterval>
+      <resolution>PT15M</resolution>
+      <Point>
+        <position>1</position>
+        <price.amount>20.0</price.amount>
+      </Point>
+    </Period>
+  </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+
+def test_mixed_resolutions_merge_at_the_finest_step():
+    # Helsinki 2025-10-01 starts with the last hour of the hourly market day
+    day = parse_publication_days(SWITCHOVER_XML)[date(2025, 10, 1)]
+    assert day.granularity == "quarter_hour"
+    assert len(day.points) == 96
+    assert list(day.points.prices[:5]) == [10.0] * 4 + [20.0]
+
+    series = parse_publication_xml(SWITCHOVER_XML)
+    assert series.granularity == "quarter_hour"
+    assert len(series.points) == 2 * 96
+
+
+def test_fetch_range_uses_one_request_per_chunk(monkeypatch):
+    monkeypatch.setattr(entsoe, "MAX_QUERY_DAYS", 1)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=TWO_DAY_XML)
+
+    async def run() -> dict[date, DaySeries]:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await fetch_day_ahead_price_range(
+                "token",
+                date(2025, 9, 13),
+                date(2025, 9, 15),
+                client=client,
+            )
+
+    days = asyncio.run(run())
+
+    assert [r.url.params["periodStart"] for r in requests] == [
+        "202509122100",
+        "202509132100",
+    ]
+    assert sorted(days) == [date(2025, 9, 13), date(2025, 9, 14)]
+
+
+def test_streaming_parser_yields_periods_before_document_ends():
+    parser = PublicationParser()
+    split_at = TWO_DAY_XML.index(b"</TimeSeries>") + len(b"</TimeSeries>")
+
+    first = []
+    for i in range(0, split_at, 64):
+        first += parser.feed(TWO_DAY_XML[i : min(i + 64, split_at)])
+    rest = parser.feed(TWO_DAY_XML[split_at:]) + parser.close()
+
+    assert [len(series) for _, series in first] == [24]
+    assert [len(series) for _, series in rest] == [24]
+
+
+ACKNOWLEDGEMENT_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">
+  <Reason>
+    <code>999</code>
+    <text>No matching data found</text>
+  </Reason>
+</Acknowledgement_MarketDocument>
+"""
+
+
+def test_acknowledgement_raises_data_not_available():
+    with pytest.raises(DataNotAvailable, match="No matching data found"):
+        parse_publication_xml(ACKNOWLEDGEMENT_XML)
+
+
+def _with_header(created: str, revision: int) -> bytes:
+    return EXAMPLE_XML.replace(
+        b"<TimeSeries>",
+        b"<mRID>doc-" + created.encode() + b"</mRID>"
+        b"<revisionNumber>" + str(revision).encode() + b"</revisionNumber>"
+        b"<createdDateTime>" + created.encode() + b"</createdDateTime>"
+        b"<TimeSeries>",
+        1,
+    )
+
+
+def test_header_metadata_and_content_digest():
+    first = _with_header("2025-08-12T11:00:00Z", 1)
+    again = _with_header("2025-08-12T11:05:00Z", 1)
+
+    ds = parse_publication_xml(first)
+
+    assert ds.published_at_utc == datetime(2025, 8, 12, 11, 0, tzinfo=UTC)
+    assert ds.revision == 1
+    # The header is regenerated per request and must not affect the digest
+    assert ds.content_digest == publication_digest(again)
+    assert ds.content_digest != publication_digest(first.replace(b"55.0", b"56.0"))
+
+
+def test_digest_is_independent_of_chunking():
+    body = _with_header("2025-08-12T11:00:00Z", 1)
+    parser = PublicationParser()
+    for i in range(0, len(body), 7):
+        parser.feed(body[i : i + 7])
+    parser.close()
+
+    assert parser.info.content_digest == publication_digest(body)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import asyncio
+
+
+def test_prices_are_resampled_for_the_requested_day_only(app_client):
+    async def run() -> None:
+        async with app_client() as client:
+            url = "/api/prices?date_str=2025-11-05"
+            quarters = (await client.get(url)).json()["intervals"]
+            assert len(quarters) == 96
+
+            hours = (await client.get(f"{url}&granularity=hour")).json()["intervals"]
+            assert len(hours) == 24
+            assert hours[0]["startTimeUtc"] == "2025-11-04T22:00:00+00:00"
+            assert hours[-1]["endTimeUtc"] == "2025-11-05T22:00:00+00:00"
+
+            days = (await client.get(f"{url}&granularity=day")).json()["intervals"]
+            assert [(d["startTimeUtc"], d["endTimeUtc"]) for d in days] == [
+                ("2025-11-04T22:00:00+00:00", "2025-11-05T22:00:00+00:00"),
+            ]
+
+    asyncio.run(run())
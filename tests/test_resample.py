@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from dateutil import tz
+
+from spot.resample import resample, resample_daily
+from spot.series import PriceSeries
+
+HELSINKI_TZ = tz.gettz("Europe/Helsinki")
+
+
+def test_upsample_repeats_each_price():
+    hourly = PriceSeries.from_prices(0, 3600, [1.0, 2.0])
+
+    quarters = resample(hourly, 900)
+
+    assert quarters.step_seconds == 900
+    assert list(quarters.prices) == [1.0] * 4 + [2.0] * 4
+
+
+@pytest.mark.parametrize(
+    ("how", "expected"),
+    [("mean", [2.5, 6.5]), ("min", [1.0, 5.0]), ("max", [4.0, 8.0])],
+)
+def test_downsample_aggregates_aligned_buckets(how, expected):
+    quarters = PriceSeries.from_prices(3600, 900, [1.0, 2.0, 3.0, 4.0, 5.0, 8.0])
+
+    hourly = resample(quarters, 3600, how)
+
+    assert hourly.start_epoch == 3600
+    assert list(hourly.prices) == expected
+
+
+def test_downsample_starting_mid_bucket():
+    quarters = PriceSeries.from_prices(3600 + 1800, 900, [2.0, 4.0, 6.0])
+
+    hourly = resample(quarters, 3600)
+
+    assert hourly.start_epoch == 3600
+    assert list(hourly.prices) == [3.0, 6.0]
+
+
+def test_daily_follows_local_midnights():
+    start = datetime(2025, 10, 25, 21, 0, tzinfo=UTC)
+    series = PriceSeries.from_prices(start, 3600, [1.0] * 25 + [3.0] * 24)
+
+    days = resample_daily(series, HELSINKI_TZ, "max")
+
+    assert [p.price_eur_per_mwh for p in days] == [1.0, 3.0]
+    assert days[0].end_utc - days[0].start_utc == days[1].start_utc - start
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from spot.responses import ResponseCache
+
+
+def test_newer_generation_drops_older_bodies():
+    cache = ResponseCache(max_bytes=100)
+    cache.put("a", 1, b"old")
+
+    assert cache.get("a", 1) == b"old"
+    assert cache.get("a", 2) is None
+
+    cache.put("b", 2, b"new")
+    cache.put("a", 1, b"late")  # built from an older snapshot
+
+    assert len(cache) == 1
+    assert cache.get("b", 2) == b"new"
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", 0, b"1234")
+    cache.put("b", 0, b"1234")
+    cache.get("a", 0)
+
+    cache.put("c", 0, b"1234")
+
+    assert cache.get("b", 0) is None
+    assert cache.get("a", 0) == b"1234"
+    assert cache.get("c", 0) == b"1234"
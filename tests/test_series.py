@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+from dateutil import tz
+
+from spot.series import (
+    PriceSeries,
+    concat_series,
+    index_by_local_date,
+    split_by_local_date,
+)
+
+HELSINKI_TZ = tz.gettz("Europe/Helsinki")
+
+
+def test_index_at_and_lazy_points():
+    start = datetime(2025, 10, 1, 0, 0, tzinfo=UTC)
+    series = PriceSeries.from_prices(start, 900, [1.0, 2.0, 3.0])
+
+    assert series.index_at(datetime(2025, 10, 1, 0, 20, tzinfo=UTC)) == 1
+    assert series.index_at(datetime(2025, 10, 1, 0, 45, tzinfo=UTC)) is None
+    assert series[2].start_utc == datetime(2025, 10, 1, 0, 30, tzinfo=UTC)
+    assert series[-1].end_utc == series.end_utc
+
+
+def test_slices_share_the_buffer():
+    series = PriceSeries.from_prices(0, 3600, [1.0, 2.0, 3.0, 4.0])
+    middle = series[1:3]
+
+    assert middle.start_epoch == 3600
+    assert list(middle.prices) == [2.0, 3.0]
+    assert middle.prices.obj is series.prices.obj
+
+
+def test_concat_prefers_later_parts_and_fills_holes():
+    first = PriceSeries.from_prices(0, 900, [1.0, 1.0])
+    later = PriceSeries.from_prices(900, 900, [2.0])
+    after_hole = PriceSeries.from_prices(3600, 900, [5.0])
+
+    merged = concat_series([first, later, after_hole])
+
+    assert list(merged.prices) == [1.0, 2.0, 2.0, 2.0, 5.0]
+
+
+def test_split_by_local_date_handles_dst_days():
+    # 2025-10-26 is 25 hours long in Helsinki
+    start = datetime(2025, 10, 25, 21, 0, tzinfo=UTC)
+    series = PriceSeries.from_prices(start, 3600, [0.0] * (25 + 24))
+
+    days = split_by_local_date(series, HELSINKI_TZ)
+
+    assert {day: len(part) for day, part in days.items()} == {
+        date(2025, 10, 26): 25,
+        date(2025, 10, 27): 24,
+    }
+
+
+def test_index_by_local_date_gives_slice_bounds():
+    # Starts one hour before Helsinki midnight and ends mid-day
+    start = datetime(2025, 10, 1, 20, 0, tzinfo=UTC)
+    series = PriceSeries.from_prices(start, 900, [0.0] * (4 + 48))
+
+    assert index_by_local_date(series, HELSINKI_TZ) == {
+        date(2025, 10, 1): (0, 4),
+        date(2025, 10, 2): (4, 52),
+    }
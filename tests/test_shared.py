@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from spot.entsoe import DaySeries
+from spot.series import PriceSeries
+from spot.shared import SharedState
+
+START = datetime(2025, 10, 19, 21, 0, tzinfo=UTC)
+
+
+def make_day(prices: list[float], digest: str) -> DaySeries:
+    return DaySeries(
+        market="FI",
+        granularity="quarter_hour",
+        points=PriceSeries.from_prices(START, 900, prices),
+        published_at_utc=datetime(2025, 10, 19, 11, 0, tzinfo=UTC),
+        revision=1,
+        content_digest=digest,
+    )
+
+
+def test_one_worker_polls_and_the_others_read_its_snapshots(tmp_path):
+    poller = SharedState(tmp_path)
+    follower = SharedState(tmp_path)
+    assert poller.try_lead()
+    assert not follower.try_lead()
+    assert follower.poll() is None
+
+    poller.publish({"FI/today": make_day([1.5, -0.25, 3.0], "a")}, {"FI": START})
+    snapshot = follower.poll()
+    assert snapshot is not None
+    today = snapshot.days["FI/today"]
+    assert list(today.points.prices) == [1.5, -0.25, 3.0]
+    assert today.points.start_epoch == int(START.timestamp())
+    assert (today.content_digest, today.revision) == ("a", 1)
+    assert snapshot.last_refresh_utc == {"FI": START}
+    # Events published before a worker first reads are not replayed
+    assert follower.unseen_events(snapshot) == []
+    assert follower.poll() is None
+
+    poller.record_event({"type": "tomorrow_updated"})
+    poller.publish(
+        {"FI/today": make_day([1.5], "a"), "FI/tomorrow": make_day([2.0] * 96, "b")},
+        {"FI": START},
+    )
+    snapshot = follower.poll()
+    assert snapshot is not None
+    assert len(snapshot.days["FI/tomorrow"].points) == 96
+    assert follower.unseen_events(snapshot) == [{"type": "tomorrow_updated"}]
+    assert follower.unseen_events(snapshot) == []
+    # Views into the replaced file stay readable
+    assert list(today.points.prices) == [1.5, -0.25, 3.0]
+
+    poller.close()
+    assert follower.try_lead()
+    follower.close()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+from spot.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    flight: SingleFlight[str, int] = SingleFlight()
+    runs = []
+
+    async def work() -> int:
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(flight.run("k", work) for _ in range(5)))
+
+    assert asyncio.run(main()) == [42] * 5
+    assert len(runs) == 1
+    assert not flight.in_flight("k")
+
+
+def test_cancelled_caller_does_not_cancel_shared_run():
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def work() -> int:
+        await asyncio.sleep(0.01)
+        return 7
+
+    async def main() -> int:
+        first = asyncio.ensure_future(flight.run("k", work))
+        second = asyncio.ensure_future(flight.run("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 7
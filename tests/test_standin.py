@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, date, datetime, time
+
+import httpx
+import pytest
+
+from spot import entsoe
+from spot.entsoe import CircuitBreaker, DataNotAvailable, TokenBucket
+from spot.standin import StandinConfig, create_app
+
+NOW = datetime(2025, 10, 25, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def fresh_policy(monkeypatch):
+    monkeypatch.setattr(entsoe, "ENTSOE_BASE_URL", "http://standin/api")
+    monkeypatch.setattr(entsoe, "RETRY_BASE_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(entsoe, "_rate_limiter", TokenBucket(1000.0, 1000.0))
+    monkeypatch.setattr(entsoe, "_circuit_breaker", CircuitBreaker(5, 60.0))
+
+
+def fetch_days(
+    config: StandinConfig,
+    start: date,
+    end: date,
+) -> dict[date, entsoe.DaySeries]:
+    async def run() -> dict[date, entsoe.DaySeries]:
+        transport = httpx.ASGITransport(app=create_app(config, clock=lambda: NOW))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await entsoe.fetch_day_ahead_price_range(
+                "token",
+                start,
+                end,
+                client=client,
+            )
+
+    return asyncio.run(run())
+
+
+def test_serves_hourly_and_quarter_hour_days_including_dst():
+    config = StandinConfig(publish_time=None)
+
+    days = fetch_days(config, date(2025, 9, 30), date(2025, 10, 27))
+
+    assert days[date(2025, 9, 30)].granularity == "hour"
+    assert len(days[date(2025, 9, 30)].points) == 24
+    assert days[date(2025, 10, 2)].granularity == "quarter_hour"
+    assert len(days[date(2025, 10, 2)].points) == 96
+    # Helsinki clocks go back on 2025-10-26
+    assert len(days[date(2025, 10, 26)].points) == 100
+
+
+def test_gap_compressed_documents_parse_to_full_days():
+    config = StandinConfig(gap_compressed=True, publish_time=None)
+
+    days = fetch_days(config, date(2025, 10, 20), date(2025, 10, 21))
+
+    prices = days[date(2025, 10, 20)].points.prices
+    assert len(prices) == 96
+    assert prices[1] == prices[0]
+
+
+def test_unpublished_days_are_acknowledged():
+    config = StandinConfig(publish_time=time(12, 45))
+
+    with pytest.raises(DataNotAvailable):
+        asyncio.run(_fetch_one(config, date(2025, 10, 28)))
+
+
+def test_outage_is_reported_as_server_error(monkeypatch):
+    monkeypatch.setattr(entsoe, "MAX_RETRIES", 0)
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        asyncio.run(_fetch_one(StandinConfig(outage=True), date(2025, 10, 20)))
+    assert excinfo.value.response.status_code == 503
+
+
+async def _fetch_one(config: StandinConfig, day: date) -> entsoe.DaySeries:
+    transport = httpx.ASGITransport(app=create_app(config, clock=lambda: NOW))
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await entsoe.fetch_day_ahead_prices("token", day, client=client)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+from datetime import UTC, datetime
+
+import pytest
+
+from spot import main
+from spot.standin import StandinConfig
+
+
+@pytest.fixture
+def upstream_config() -> StandinConfig:
+    # Slow enough that requests arrive while warmup is still fetching
+    return StandinConfig(publish_time=None, latency_seconds=0.3)
+
+
+def test_startup_serves_pending_responses_until_warm(app_client):
+    async def run() -> None:
+        async with app_client(warm=False) as client:
+            # Upstream is still answering the warmup fetch
+            assert (await client.get("/healthz")).status_code == 200
+            ready = await client.get("/readyz")
+            assert ready.status_code == 503
+            assert ready.json()["zones"]["FI"]["warming"] is True
+
+            chart = await client.get("/api/chart-data?date_str=today")
+            assert chart.status_code == 503
+            assert chart.headers["Retry-After"] == str(main.PENDING_RETRY_SECONDS)
+            partial = await client.get("/partials/prices?date=today&margin=0")
+            assert partial.status_code == 200
+            assert "load delay:" in partial.text
+
+            for _ in range(100):
+                ready = await client.get("/readyz")
+                if ready.status_code == 200:
+                    break
+                await asyncio.sleep(0.05)
+            assert ready.json()["zones"]["FI"]["today"] is True
+            chart = await client.get("/api/chart-data?date_str=today")
+            assert chart.status_code == 200
+            assert chart.json()["data"]
+
+    asyncio.run(run())
+
+
+def test_stale_cache_is_served_while_it_revalidates(app_client):
+    async def run() -> None:
+        async with app_client() as client:
+            main.caches["FI"].swap(last_refresh_utc=datetime(2025, 1, 1, tzinfo=UTC))
+            chart = await client.get("/api/chart-data?date_str=today")
+            assert chart.status_code == 200
+            assert chart.json()["stale"] is True
+            assert chart.json()["data"]
+
+            for _ in range(100):
+                chart = await client.get("/api/chart-data?date_str=today")
+                if not chart.json()["stale"]:
+                    break
+                await asyncio.sleep(0.05)
+            assert chart.json()["stale"] is False
+
+    asyncio.run(run())
+
+
+def test_chart_bundle_matches_per_day_chart_data(app_client):
+    async def run() -> None:
+        async with app_client() as client:
+            bundle = (await client.get("/api/chart-bundle?margin=0.5")).json()
+            for name in ("today", "tomorrow"):
+                day = (
+                    await client.get(
+                        f"/api/chart-data?date_str={name}&margin=0.5&format=compact",
+                    )
+                ).json()
+                assert bundle["days"][name]["spot"] == day["spot"]
+                assert bundle["days"][name]["start"] == day["start"]
+                assert (bundle["minPrice"], bundle["maxPrice"]) == (
+                    day["minPrice"],
+                    day["maxPrice"],
+                )
+            assert 0 <= bundle["now"]["slot"] < bundle["days"]["today"]["intervalCount"]
+
+    asyncio.run(run())
+
+
+def test_repeat_partials_are_served_from_the_fragment_cache(app_client, monkeypatch):
+    renders = []
+    build_view_model = main.build_view_model
+
+    def counting_build_view_model(*args: t.Any) -> dict[str, t.Any]:
+        renders.append(args)
+        return build_view_model(*args)
+
+    monkeypatch.setattr(main, "build_view_model", counting_build_view_model)
+
+    async def run() -> None:
+        async with app_client() as client:
+            url = "/partials/prices?date=today&margin=0.5"
+            first = await client.get(url)
+            second = await client.get(url)
+            assert second.status_code == 200
+            assert second.text == first.text
+            assert len(renders) == 1
+            await client.get("/partials/prices?date=today&margin=1.0")
+            assert len(renders) == 2
+
+    asyncio.run(run())
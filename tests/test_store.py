@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+from spot.entsoe import DaySeries
+from spot.series import PriceSeries
+from spot.store import PriceStore
+
+DAY = date(2025, 10, 20)
+START = datetime(2025, 10, 19, 21, 0, tzinfo=UTC)
+
+
+def test_round_trip_prefers_finest_resolution(tmp_path):
+    store = PriceStore.open(tmp_path / "prices.sqlite3")
+    hourly = DaySeries(
+        "FI",
+        "hour",
+        PriceSeries.from_prices(START, 3600, [1.0] * 24),
+        datetime(2025, 10, 19, 11, 0, tzinfo=UTC),
+        revision=1,
+        content_digest="abc",
+    )
+    quarter_hourly = DaySeries(
+        "FI",
+        "quarter_hour",
+        PriceSeries.from_prices(START, 900, [float(i) for i in range(96)]),
+        None,
+    )
+    store.save("FI", DAY, hourly)
+    store.save("FI", DAY, quarter_hourly)
+    store.close()
+
+    reopened = PriceStore.open(tmp_path / "prices.sqlite3")
+
+    assert reopened.load("FI", DAY) == quarter_hourly
+    assert reopened.load("FI", DAY, "hour") == hourly
+    assert reopened.load("FI", date(2025, 10, 21)) is None
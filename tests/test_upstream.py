@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from spot import entsoe
+from spot.entsoe import (
+    CircuitBreaker,
+    NotModified,
+    TokenBucket,
+    UpstreamUnavailable,
+)
+
+HOURLY_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+  <TimeSeries>
+    <Period>
+      <timeInterval>
+        <start>2025-09-12T21:00Z</start>
+        <end>2025-09-13T21:00Z</end>
+      </timeInterval>
+      <resolution>PT60M</resolution>
+      <Point>
+        <position>1</position>
+        <price.amount>10.0</price.amount>
+      </Point>
+    </Period>
+  </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def fresh_policy(monkeypatch):
+    monkeypatch.setattr(entsoe, "RETRY_BASE_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(entsoe, "_rate_limiter", TokenBucket(1000.0, 1000.0))
+    monkeypatch.setattr(entsoe, "_circuit_breaker", CircuitBreaker(2, 60.0))
+
+
+def fetch_with(handler, known_digest: str | None = None) -> entsoe.DaySeries:
+    async def run() -> entsoe.DaySeries:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await entsoe.fetch_day_ahead_prices(
+                "token",
+                date(2025, 9, 13),
+                client=client,
+                known_digest=known_digest,
+            )
+
+    return asyncio.run(run())
+
+
+def test_429_is_retried_after_retry_after():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, content=HOURLY_XML),
+    ]
+
+    series = fetch_with(lambda _request: responses.pop(0))
+
+    assert responses == []
+    assert series.granularity == "hour"
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(401, content=b"Unauthorized")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch_with(handler)
+    assert len(calls) == 1
+
+
+def test_open_circuit_fails_fast_without_requests(monkeypatch):
+    monkeypatch.setattr(entsoe, "MAX_RETRIES", 1)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch_with(handler)
+    with pytest.raises(UpstreamUnavailable):
+        fetch_with(handler)
+    assert len(calls) == 2
+
+
+def test_circuit_breaker_half_open_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(1, 30.0, clock=clock)
+    breaker.record_failure()
+
+    with pytest.raises(UpstreamUnavailable):
+        breaker.before_request()
+
+    clock.now = 31.0
+    breaker.before_request()  # trial request allowed
+    with pytest.raises(UpstreamUnavailable):
+        breaker.before_request()  # only one trial at a time
+    breaker.record_success()
+    breaker.before_request()
+    assert not breaker.is_open
+
+
+def test_cancelled_trial_does_not_keep_the_circuit_open(monkeypatch):
+    clock = FakeClock()
+    breaker = CircuitBreaker(1, 30.0, clock=clock)
+    breaker.record_failure()
+    monkeypatch.setattr(entsoe, "_circuit_breaker", breaker)
+    clock.now = 31.0
+
+    async def hang(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(10)
+        return httpx.Response(200, content=HOURLY_XML)
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(hang)) as client:
+            trial = asyncio.create_task(
+                entsoe.fetch_day_ahead_prices(
+                    "token",
+                    date(2025, 9, 13),
+                    client=client,
+                ),
+            )
+            await asyncio.sleep(0.01)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+
+    asyncio.run(run())
+    breaker.before_request()  # the next request may be the trial
+    assert breaker.is_open
+
+
+def test_token_bucket_spaces_requests_beyond_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=2.0, capacity=2.0, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_concurrent_fetches_for_same_day_share_one_request():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=HOURLY_XML)
+
+    async def run() -> list[entsoe.DaySeries]:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await asyncio.gather(
+                entsoe.fetch_day_ahead_prices("t", date(2025, 9, 13), client=client),
+                entsoe.fetch_day_ahead_prices(
+                    "t",
+                    date(2025, 9, 13),
+                    prefer_15min=True,
+                    client=client,
+                ),
+            )
+
+    hourly, quarter_hourly = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert hourly.granularity == "hour"
+    assert quarter_hourly.granularity == "quarter_hour"
+
+
+def test_unchanged_republication_raises_not_modified(monkeypatch):
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=HOURLY_XML)
+
+    series = fetch_with(handler)
+
+    def no_parse(*_args):
+        raise AssertionError("unchanged body must not be parsed")
+
+    monkeypatch.setattr(entsoe.PublicationParser, "feed", no_parse)
+    with pytest.raises(NotModified):
+        fetch_with(handler, known_digest=series.content_digest)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import base64
+from array import array
+from datetime import UTC, date, datetime
+
+import pytest
+
+from spot.main import DayPrices
+from spot.series import PriceSeries
+from spot.views import (
+    build_chart_columns,
+    build_chart_rows,
+    encode_float32,
+    price_range,
+)
+
+
+def test_chart_rows_cover_the_whole_day_and_skip_other_days():
+    # Helsinki 2025-10-02 starts at 21:00 UTC the day before
+    start = datetime(2025, 10, 1, 20, 0, tzinfo=UTC)
+    dp = DayPrices(
+        "FI",
+        "hour",
+        PriceSeries.from_prices(start, 3600, [800.0] + [100.0] * 3),
+        None,
+    )
+
+    rows, granularity, has_data = build_chart_rows(dp, date(2025, 10, 2), 0.5)
+
+    assert granularity == "hour"
+    assert has_data
+    assert len(rows) == 24
+    assert rows[0] == ["0", 0, pytest.approx(12.55), 0, 0.5]
+    assert rows[3] == ["3", 0, 0, 0, 0.5]
+
+
+def test_chart_columns_hold_prices_from_the_first_priced_slot():
+    # Prices for Helsinki 02:00-04:00 only
+    start = datetime(2025, 10, 1, 23, 0, tzinfo=UTC)
+    dp = DayPrices("FI", "hour", PriceSeries.from_prices(start, 3600, [80.0] * 2), None)
+
+    slots, first, spot, granularity = build_chart_columns(dp, date(2025, 10, 2))
+
+    assert (slots, first, granularity) == (24, 2, "hour")
+    assert spot == [pytest.approx(10.04)] * 2
+    decoded = array("f", base64.b64decode(encode_float32([*spot, None])))
+    assert decoded[0] == pytest.approx(10.04)
+    assert decoded[2] != decoded[2]
+
+
+def test_price_range_rounds_to_axis_bounds():
+    dp = DayPrices(
+        "FI",
+        "hour",
+        PriceSeries.from_prices(0, 3600, [-15.0, 100.0, 40.0]),
+        None,
+    )
+
+    assert dp.extrema == (-15.0, 100.0)
+    assert price_range([dp.extrema, None], 0.5)[2:] == (-2, 15)
+    assert price_range([], 0.0) == (0.0, 25.0, 0, 30)